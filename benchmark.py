@@ -0,0 +1,679 @@
+"""
+Benchmarks du jeu (mode Classic et Arcade)
+
+Micro-benchmarks : comparaison des optimisations avec leur ancienne version
+    python benchmark.py [nom_du_benchmark ...]
+
+Scénarios de charge : le vrai code du jeu dans les pires cas (200 objets, lame en continu,
+particules au maximum, chargement à froid), avec opérations/s et percentiles
+    python benchmark.py --stress [scénario ...] [--json FICHIER] [--baseline FICHIER] [--tolerance 0.1]
+Avec --baseline, le code de sortie vaut 1 si un scénario a régressé par rapport à la référence.
+
+Allocations : longues parties sans réserves d'objets, avec réserves, puis avec réserves et
+ramasse-miettes différé ; objets créés, collectes et variation des durées de frame
+    python benchmark.py --allocations [session ...] [--json FICHIER] [--scale 1.0]
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Pas besoin de fenêtre ni de son pour mesurer
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# Sortie standard réservée aux résultats (--json -)
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pygame
+from PIL import Image
+
+import main1
+import pools
+from particles import ParticleSystem
+from timestep import SimulationClock, use_clock
+
+
+def measure(func, repeat=5):
+    # Renvoie le meilleur temps (en secondes) sur plusieurs exécutions
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def remove_background_loop(image_path, white_threshold=230, brown_threshold=30):
+    # Ancienne version pixel par pixel, gardée comme référence
+    img = Image.open(image_path).convert("RGBA")
+    new_data = []
+    for item in img.getdata():
+        if (item[0] > white_threshold and item[1] > white_threshold and item[2] > white_threshold) or \
+           (item[0] < brown_threshold and item[1] < brown_threshold and item[2] < brown_threshold):
+            new_data.append((255, 255, 255, 0))
+        else:
+            new_data.append(item)
+    img.putdata(new_data)
+    return img
+
+
+def bench_remove_background():
+    for image_path in ['assets_fruits/ananas.png', 'assets_fruits/ananas_sliced2.png']:
+        # Les deux versions doivent donner exactement le même résultat
+        expected = remove_background_loop(image_path).tobytes()
+        result = main1.AssetLoader.remove_background(image_path).tobytes()
+        assert expected == result, f"Résultat différent pour {image_path}"
+
+        loop_time = measure(lambda: remove_background_loop(image_path))
+        numpy_time = measure(lambda: main1.AssetLoader.remove_background(image_path))
+        print(f"{image_path}: boucle {loop_time * 1000:.1f} ms, "
+              f"numpy {numpy_time * 1000:.1f} ms (x{loop_time / numpy_time:.1f})")
+
+
+def bench_sprite_cache():
+    # Chargement à froid (cache vide) puis à chaud (cache rempli)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            main1.AssetLoader.sprite_cache = main1.SpriteCache(cache_dir)
+            main1.AssetLoader.load_assets()
+
+        def warm():
+            main1.AssetLoader.sprite_cache = main1.SpriteCache(cache_dir)
+            main1.AssetLoader.load_assets()
+
+        cold_time = measure(cold, repeat=3)
+        warm_time = measure(warm, repeat=3)
+    main1.AssetLoader.sprite_cache = main1.SpriteCache()
+    print(f"load_assets: sans cache {cold_time * 1000:.1f} ms, "
+          f"avec cache {warm_time * 1000:.1f} ms (x{cold_time / warm_time:.1f})")
+
+
+def bench_rotation_cache(frames=300, count=60):
+    main1.AssetLoader.load_assets()
+    objects = [main1.GameObject(100 + i * 15, 400, 'fruit') for i in range(count)]
+
+    def run():
+        for _ in range(frames):
+            for obj in objects:
+                obj.angle += obj.rotation_speed
+                obj.draw(main1.screen)
+
+    # Un budget nul revient à tourner le sprite à chaque frame
+    results = {}
+    for label, budget in [('sans cache', 0), ('avec cache', main1.ROTATION_CACHE_BUDGET)]:
+        main1.rotation_cache = main1.RotationCache(memory_budget=budget)
+        results[label] = measure(run, repeat=3)
+        print(f"{label}: {results[label] / frames * 1000:.2f} ms/frame pour {count} objets")
+    print(main1.rotation_cache.report())
+    main1.rotation_cache = main1.RotationCache()
+
+
+class ParticleObject:
+    # Ancienne particule (un objet Python par particule), gardée comme référence
+    def __init__(self, x, y, color):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.size = random.randint(2, 5)
+        angle = random.uniform(0, 2 * math.pi)
+        speed = random.uniform(2, 5)
+        self.vx = math.cos(angle) * speed
+        self.vy = math.sin(angle) * speed
+        self.lifetime = 30
+
+    def update(self):
+        self.x += self.vx
+        self.y += self.vy
+        self.vy += 0.1
+        self.lifetime -= 1
+        self.size = max(0, self.size - 0.1)
+
+    def draw(self, screen):
+        if self.lifetime > 0:
+            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
+
+
+def bench_particles(frames=120, per_frame=100):
+    # Une explosion de per_frame particules à chaque frame (~3000 vivantes en continu)
+    color = (200, 180, 0)
+
+    def run_objects():
+        particles = []
+        for _ in range(frames):
+            particles.extend(ParticleObject(640, 460, color) for _ in range(per_frame))
+            for particle in particles[:]:
+                particle.update()
+                particle.draw(main1.screen)
+                if particle.lifetime <= 0:
+                    particles.remove(particle)
+
+    def run_arrays():
+        system = ParticleSystem(capacity=4096, gravity=0.1, shrink=0.1)
+        for _ in range(frames):
+            system.emit(640, 460, per_frame, color)
+            system.update()
+            system.draw(main1.screen)
+
+    objects_time = measure(run_objects, repeat=3)
+    arrays_time = measure(run_arrays, repeat=3)
+    print(f"objets Python: {objects_time / frames * 1000:.2f} ms/frame, "
+          f"tableaux NumPy: {arrays_time / frames * 1000:.2f} ms/frame (x{objects_time / arrays_time:.1f})")
+
+
+def sweep_blade_all(game, path):
+    # Même détection continue, objet par objet et segment par segment, gardée comme référence
+    steps = len(path) - 1
+    if sum(math.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(path, path[1:])) <= main1.MIN_BLADE_DISTANCE:
+        return []
+    hits = []
+    for order, obj in enumerate(game.objects):
+        if obj.sliced:
+            continue
+        motion_x, motion_y = obj.x - obj.prev_x, obj.y - obj.prev_y
+        radius = obj.cut_radius()
+        for k in range(steps):
+            (x1, y1), (x2, y2) = path[k], path[k + 1]
+            start_x = obj.prev_x + motion_x * (k / steps)
+            start_y = obj.prev_y + motion_y * (k / steps)
+            end_x = obj.prev_x + motion_x * ((k + 1) / steps)
+            end_y = obj.prev_y + motion_y * ((k + 1) / steps)
+            d0x, d0y = start_x - x1, start_y - y1
+            dvx, dvy = (end_x - start_x) - (x2 - x1), (end_y - start_y) - (y2 - y1)
+            dv_squared = dvx * dvx + dvy * dvy
+            u = -(d0x * dvx + d0y * dvy) / dv_squared if dv_squared > 0 else 0.0
+            u = min(max(u, 0.0), 1.0)
+            closest_x, closest_y = d0x + dvx * u, d0y + dvy * u
+            if closest_x * closest_x + closest_y * closest_y < radius * radius:
+                hits.append((k + u, order, obj))
+                break
+    return [obj for _, _, obj in sorted(hits, key=lambda hit: hit[:2])]
+
+
+def crowded_game(count=200, seed=1):
+    # Partie avec count objets en mouvement répartis sur tout l'écran
+    main1.AssetLoader.load_assets()
+    random.seed(seed)
+    game = main1.Game(scoreboard=main1.Scoreboard(filename=None))
+    for _ in range(count):
+        object_type = random.choice(['fruit', 'bomb', 'ice'])
+        obj = main1.GameObject(random.randint(0, main1.WINDOW_WIDTH), 0, object_type)
+        obj.y = random.randint(0, main1.WINDOW_HEIGHT)
+        game.add_object(obj)
+        obj.update()
+    game.grid.rebuild(game.objects)
+    return game
+
+
+def bench_blade_sweep(count=200, frames=500, points_per_frame=16):
+    # Souris à 1000 Hz : ~16 positions par frame à 60 FPS
+    game = crowded_game(count)
+    paths = []
+    for _ in range(frames):
+        x, y = random.randint(0, main1.WINDOW_WIDTH), random.randint(0, main1.WINDOW_HEIGHT)
+        dx, dy = random.uniform(-15, 15), random.uniform(-15, 15)
+        paths.append([(x + dx * i, y + dy * i) for i in range(points_per_frame + 1)])
+
+    # Les deux détections doivent trouver les mêmes objets dans le même ordre
+    for path in paths:
+        assert game.sweep_blade(path) == sweep_blade_all(game, path)
+
+    all_time = measure(lambda: [sweep_blade_all(game, path) for path in paths], repeat=3)
+    sweep_time = measure(lambda: [game.sweep_blade(path) for path in paths], repeat=3)
+    print(f"{count} objets, {frames} frames de {points_per_frame} segments : "
+          f"boucle Python {all_time / frames * 1000:.2f} ms/frame, "
+          f"grille + numpy {sweep_time / frames * 1000:.2f} ms/frame (x{all_time / sweep_time:.1f})")
+
+
+def objects_for_key_scan(game, key):
+    # Ancienne recherche : parcours de tous les objets, gardée comme référence
+    return [obj for obj in game.objects if not obj.sliced and obj.key == key]
+
+
+def bench_handle_key(count=500, events=5000, seed=2):
+    # Frappe rapide sur un plateau chargé : des touches du jeu (sans la bombe) et d'autres lettres
+    keys = main1.GameObject.FRUIT_KEYS + [main1.GameObject.ICE_KEY] + [pygame.K_b, pygame.K_t, pygame.K_u, pygame.K_o]
+    results = {}
+    for label in ['parcours', 'index']:
+        game = crowded_game(count, seed)
+        if label == 'parcours':
+            game.objects_for_key = lambda key, game=game: objects_for_key_scan(game, key)
+        replay = random.Random(seed)
+        key_events = [replay.choice(keys) for _ in range(events)]
+        # Un nouvel objet toutes les 10 touches pour garder des cibles
+        spawns = [main1.GameObject(replay.randint(0, main1.WINDOW_WIDTH), 400, 'fruit') for _ in range(events // 10)]
+
+        start = time.perf_counter()
+        for i, key in enumerate(key_events):
+            if i % 10 == 0:
+                game.add_object(spawns[i // 10])
+            game.handle_key(key)
+        elapsed = time.perf_counter() - start
+        results[label] = (elapsed, game.score, [obj.sliced for obj in game.objects])
+        print(f"{label}: {events / elapsed:.0f} touches/s ({elapsed * 1000:.1f} ms pour {events} touches)")
+
+    # Les deux versions doivent couper les mêmes objets et donner le même score
+    assert results['parcours'][1:] == results['index'][1:]
+    print(f"x{results['parcours'][0] / results['index'][0]:.1f}")
+
+
+def draw_trail_lines(trail, screen):
+    # Ancien rendu : 4 draw.line par segment directement sur l'écran, gardé comme référence
+    for i in range(len(trail.points) - 1):
+        start = trail.points[i]
+        end = trail.points[i + 1]
+        pygame.draw.line(screen, (0, 100, 255, 50), start, end, 20)
+        pygame.draw.line(screen, (100, 200, 255, 100), start, end, 15)
+        pygame.draw.line(screen, trail.colors[i], start, end, 10)
+        pygame.draw.line(screen, (255, 255, 255, 255), start, end, 4)
+
+
+def bench_trail(frames=300):
+    # Traînée à sa longueur maximale, en mouvement (un nouveau point par frame)
+    trail = main1.Trail()
+    points = [(640 + math.cos(i / 10) * 400, 460 + math.sin(i / 7) * 300) for i in range(frames + trail.max_length)]
+
+    def run(draw):
+        trail.points = []
+        for point in points:
+            trail.add_point(point)
+            if len(trail.points) == trail.max_length:
+                draw(trail, main1.screen)
+
+    lines_time = measure(lambda: run(draw_trail_lines), repeat=3)
+    layer_time = measure(lambda: run(main1.Trail.draw), repeat=3)
+    print(f"traînée de {trail.max_length} points : draw.line {lines_time / frames * 1000:.3f} ms/frame, "
+          f"calque {layer_time / frames * 1000:.3f} ms/frame (x{lines_time / layer_time:.1f})")
+
+
+BENCHMARKS = {
+    'remove_background': bench_remove_background,
+    'sprite_cache': bench_sprite_cache,
+    'rotation_cache': bench_rotation_cache,
+    'particles': bench_particles,
+    'blade_sweep': bench_blade_sweep,
+    'handle_key': bench_handle_key,
+    'trail': bench_trail,
+}
+
+
+# Scénarios de charge
+# Chaque scénario prépare son état et renvoie une fonction qui exécute une opération
+# (une frame, un chargement...) ; chaque opération est chronométrée séparément.
+# Un scénario qui laisse quelque chose à défaire renvoie (opération, nettoyage).
+
+STRESS_OBJECTS = 200
+SWIPE_POINTS = 16  # Positions de la souris par frame (souris à 1000 Hz, jeu à 60 FPS)
+
+
+def prepare(setup):
+    # Renvoie (opération, nettoyage ou None)
+    prepared = setup()
+    return prepared if isinstance(prepared, tuple) else (prepared, None)
+
+
+def sample(operation, iterations, warmup):
+    # Durée de chaque opération (en secondes), après quelques opérations de chauffe
+    for _ in range(warmup):
+        operation()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    ms = np.array(samples) * 1000
+    p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+    return {
+        'iterations': len(samples),
+        'ops_per_sec': round(len(samples) / (ms.sum() / 1000), 2),
+        'mean_ms': round(float(ms.mean()), 4),
+        'p50_ms': round(float(p50), 4),
+        'p90_ms': round(float(p90), 4),
+        'p99_ms': round(float(p99), 4),
+        'max_ms': round(float(ms.max()), 4),
+    }
+
+
+def keep_crowded(game, count, rng, object_type=None):
+    # Relance des objets depuis le bas de l'écran pour garder count objets non coupés
+    missing = count - sum(len(bucket) for bucket in game.key_buckets.values())
+    for _ in range(missing):
+        kind = object_type or rng.choices(['fruit', 'bomb', 'ice'], weights=game.settings['weights'])[0]
+        game.add_object(main1.object_pool.acquire(rng.randint(0, main1.WINDOW_WIDTH), main1.WINDOW_HEIGHT, kind, rng))
+
+
+stress_games = []  # Partie du scénario précédent, dont les objets retournent dans la réserve
+
+
+def classic_stress_game(object_type=None, seed=3):
+    # Partie du mode Classic sur une horloge simulée, remplie de STRESS_OBJECTS objets
+    while stress_games:
+        stress_games.pop().release_objects()
+    main1.AssetLoader.load_assets()
+    clock = SimulationClock()
+    use_clock(clock)
+    game = main1.Game(scoreboard=main1.Scoreboard(filename=None), seed=seed)
+    stress_games.append(game)
+    rng = random.Random(seed)
+    keep_crowded(game, STRESS_OBJECTS, rng, object_type)
+    return game, clock, rng
+
+
+def scenario_classic_objects():
+    # Une frame complète (pas de simulation + dessin) avec 200 objets à l'écran, sans joueur
+    game, clock, rng = classic_stress_game()
+    canvas = pygame.Surface((main1.WINDOW_WIDTH, main1.WINDOW_HEIGHT))
+    mouse_pos = (main1.WINDOW_WIDTH // 2, main1.WINDOW_HEIGHT // 2)
+
+    def frame():
+        game.strikes = 0  # Pas de game over pendant la mesure
+        keep_crowded(game, STRESS_OBJECTS, rng)
+        game.step(mouse_pos)
+        game.draw(canvas)
+        clock.tick()
+    return frame
+
+
+def scenario_classic_swipe():
+    # Lame en mouvement permanent (zigzag sur tout l'écran) au milieu de 200 fruits
+    game, clock, rng = classic_stress_game(object_type='fruit')
+    canvas = pygame.Surface((main1.WINDOW_WIDTH, main1.WINDOW_HEIGHT))
+    position = [0]
+    game.apply_input('down', (0, main1.WINDOW_HEIGHT // 2))
+
+    def blade_position(t):
+        x = (t * 6) % (2 * main1.WINDOW_WIDTH)
+        x = x if x < main1.WINDOW_WIDTH else 2 * main1.WINDOW_WIDTH - x
+        return (x, main1.WINDOW_HEIGHT / 2 + math.sin(t / 40) * main1.WINDOW_HEIGHT / 3)
+
+    def frame():
+        game.strikes = 0
+        game.game_over = False
+        keep_crowded(game, STRESS_OBJECTS, rng, 'fruit')
+        for _ in range(SWIPE_POINTS):
+            position[0] += 1
+            game.apply_input('move', blade_position(position[0]))
+        game.step(blade_position(position[0]))
+        game.draw(canvas)
+        clock.tick()
+    return frame
+
+
+def scenario_particles_max():
+    # Système de particules des découpes rempli à sa capacité, renouvelé en continu
+    system = main1.slice_particles
+    system.clear()
+    canvas = pygame.Surface((main1.WINDOW_WIDTH, main1.WINDOW_HEIGHT))
+    colors = [(255, 0, 0), (255, 200, 0), (0, 200, 0), (255, 120, 0)]
+    per_frame = system.capacity // 30 + 1  # Durée de vie de 30 frames
+    for _ in range(30):
+        system.emit(main1.WINDOW_WIDTH / 2, main1.WINDOW_HEIGHT / 2, per_frame, colors)
+        system.update()
+
+    def frame():
+        system.emit(main1.WINDOW_WIDTH / 2, main1.WINDOW_HEIGHT / 2, per_frame, colors)
+        system.update()
+        system.draw(canvas)
+    return frame
+
+
+def scenario_assets_cold():
+    # Chargement de tous les assets du mode Classic, cache de sprites vide
+    cache_dir = tempfile.mkdtemp()
+    original_cache = main1.AssetLoader.sprite_cache
+
+    def load():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        main1.AssetLoader.sprite_cache = main1.SpriteCache(cache_dir)
+        main1.AssetLoader.load_assets()
+
+    def cleanup():
+        # Les scénarios suivants retrouvent le cache habituel
+        main1.AssetLoader.sprite_cache = original_cache
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return load, cleanup
+
+
+def scenario_arcade_collisions(count=STRESS_OBJECTS):
+    # Un pas de simulation du mode Arcade avec count objets et les 3 armes en vol
+    import headless
+    main4 = headless.arcade_module()
+    main4.rng.seed(4)
+    clock = SimulationClock()
+    use_clock(clock)
+    main4.reset_game_state()
+    player = main4.Player()
+    keys = {pygame.K_LEFT: False, pygame.K_RIGHT: False}
+
+    def step():
+        main4.game_over = False
+        main4.frozen = False  # Objets toujours en mouvement
+        while len(main4.objects) < count:
+            main4.spawn_object()
+        player.x = main4.rng.randint(0, main4.WIDTH - player.width)
+        main4.shoot_weapon(player)
+        main4.step_game(player, keys)
+        clock.tick()
+    return step
+
+
+def scenario_arcade_crowded():
+    # Même pas, avec 500 objets face aux 3 armes (détection de collisions)
+    return scenario_arcade_collisions(500)
+
+
+# Nom -> (préparation, nombre d'opérations mesurées, opérations de chauffe)
+SCENARIOS = {
+    'classic_200_objects': (scenario_classic_objects, 600, 60),
+    'classic_swipe': (scenario_classic_swipe, 600, 60),
+    'particles_max': (scenario_particles_max, 600, 30),
+    'assets_cold_load': (scenario_assets_cold, 5, 1),
+    'arcade_200_objects': (scenario_arcade_collisions, 2000, 100),
+    'arcade_500_objects': (scenario_arcade_crowded, 2000, 100),
+}
+
+
+def run_scenarios(names, scale=1.0):
+    results = {}
+    for name in names:
+        setup, iterations, warmup = SCENARIOS[name]
+        cleanup = None
+        try:
+            operation, cleanup = prepare(setup)
+            results[name] = summarize(sample(operation, max(1, int(iterations * scale)), warmup))
+        finally:
+            if cleanup:
+                cleanup()
+            use_clock(None)
+        stats = results[name]
+        print(f"{name:<22} {stats['ops_per_sec']:>10.1f} ops/s  p50 {stats['p50_ms']:8.3f} ms  "
+              f"p90 {stats['p90_ms']:8.3f} ms  p99 {stats['p99_ms']:8.3f} ms")
+    return results
+
+
+# Allocations et régularité des frames
+# Chaque session rejoue un scénario de charge pendant une longue partie, dans chaque configuration.
+
+ALLOCATION_SESSIONS = {
+    'classic_swipe': (scenario_classic_swipe, 3000),
+    'arcade_200_objects': (scenario_arcade_collisions, 6000),
+}
+# Nom -> (réserves d'objets actives, ramasse-miettes différé)
+ALLOCATION_CONFIGS = {
+    'sans_reserve': (False, False),
+    'reserve': (True, False),
+    'reserve_gc_differe': (True, True),
+}
+
+
+def run_allocation_session(setup, frames, use_pools, defer_gc, warmup=60):
+    pools.set_enabled(use_pools)
+    pools.DEFER_GC = defer_gc
+    collections = [0, 0, 0]
+    pauses = []
+    started = []
+
+    def on_gc(phase, info):
+        if phase == 'start':
+            started.append(time.perf_counter())
+        else:
+            collections[info['generation']] += 1
+            pauses.append(time.perf_counter() - started.pop())
+
+    cleanup = None
+    try:
+        operation, cleanup = prepare(setup)
+        for _ in range(warmup):
+            operation()
+        for pool in pools.POOLS:
+            pool.reset_stats()
+        gc.collect()
+        gc.callbacks.append(on_gc)
+        pools.pause_gc()
+        samples = sample(operation, frames, 0)
+    finally:
+        # La collecte du retour au menu n'est pas comptée : elle a lieu hors partie
+        if on_gc in gc.callbacks:
+            gc.callbacks.remove(on_gc)
+        pools.resume_gc()
+        if cleanup:
+            cleanup()
+        use_clock(None)
+
+    stats = summarize(samples)
+    stats['std_ms'] = round(float(np.std(samples) * 1000), 4)
+    stats['gc_collections'] = collections
+    stats['gc_pause_max_ms'] = round(max(pauses, default=0.0) * 1000, 4)
+    stats['pools'] = {pool.name: {'created': pool.created, 'reused': pool.reused,
+                                  'high_water': pool.high_water}
+                      for pool in pools.POOLS if pool.created or pool.reused}
+    stats['created_per_sec'] = round(sum(pool['created'] for pool in stats['pools'].values())
+                                     / (np.sum(samples) or 1), 1)
+    return stats
+
+
+def run_allocations(names, scale=1.0):
+    results = {}
+    initial = (pools.enabled, pools.DEFER_GC)
+    for name in names:
+        setup, frames = ALLOCATION_SESSIONS[name]
+        for config, (use_pools, defer_gc) in ALLOCATION_CONFIGS.items():
+            stats = run_allocation_session(setup, max(1, int(frames * scale)), use_pools, defer_gc)
+            results[f"{name}/{config}"] = stats
+            created = sum(pool['created'] for pool in stats['pools'].values())
+            print(f"{name:<19} {config:<19} p50 {stats['p50_ms']:7.3f} ms  p99 {stats['p99_ms']:7.3f} ms  "
+                  f"max {stats['max_ms']:7.3f} ms  écart-type {stats['std_ms']:6.3f} ms  "
+                  f"{created:>6} objets créés  collectes {stats['gc_collections']}")
+    pools.set_enabled(initial[0])
+    pools.DEFER_GC = initial[1]
+    return results
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare les résultats à une référence enregistrée avec --json
+    Régression : ops/s en baisse ou p99 en hausse de plus de tolerance (0.1 = 10 %)
+    Renvoie la liste des scénarios en régression
+    """
+    regressions = []
+    print(f"Comparaison avec la référence (tolérance {tolerance:.0%})")
+    for name, stats in results.items():
+        reference = baseline['scenarios'].get(name)
+        if reference is None:
+            print(f"{name:<22} absent de la référence")
+            continue
+        throughput = stats['ops_per_sec'] / reference['ops_per_sec'] - 1
+        latency = stats['p99_ms'] / reference['p99_ms'] - 1
+        regressed = throughput < -tolerance or latency > tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<22} ops/s {throughput:+7.1%}  p99 {latency:+7.1%}  {'RÉGRESSION' if regressed else 'ok'}")
+    return regressions
+
+
+def write_report(report, destination, output):
+    # destination : fichier JSON, '-' pour output (la sortie standard d'origine), None pour rien
+    if destination == '-':
+        json.dump(report, output, indent=2)
+        output.write('\n')
+    elif destination:
+        with open(destination, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Résultats enregistrés dans {destination}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks du jeu")
+    parser.add_argument('names', nargs='*', help="benchmarks (ou scénarios avec --stress) à lancer")
+    parser.add_argument('--stress', action='store_true', help="scénarios de charge au lieu des micro-benchmarks")
+    parser.add_argument('--allocations', action='store_true',
+                        help="objets créés et régularité des frames, avec et sans réserves d'objets")
+    parser.add_argument('--json', help="fichier où écrire les résultats (- pour la sortie standard)")
+    parser.add_argument('--baseline', help="résultats de référence (écrits par --json) à comparer")
+    parser.add_argument('--tolerance', type=float, default=0.1)
+    parser.add_argument('--scale', type=float, default=1.0, help="multiplie le nombre d'opérations mesurées")
+    args = parser.parse_args()
+
+    if args.allocations:
+        unknown = [name for name in args.names if name not in ALLOCATION_SESSIONS]
+        if unknown:
+            parser.error(f"session inconnue : {', '.join(unknown)} (disponibles : {', '.join(ALLOCATION_SESSIONS)})")
+        output = sys.stdout
+        if args.json == '-':
+            sys.stdout = sys.stderr
+        results = run_allocations(args.names or list(ALLOCATION_SESSIONS), args.scale)
+        write_report({'version': 1, 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                      'environment': environment(), 'allocations': results}, args.json, output)
+        return
+
+    if not args.stress:
+        for name in args.names or list(BENCHMARKS):
+            if name not in BENCHMARKS:
+                print(f"Benchmark inconnu : {name}")
+                continue
+            print(f"== {name} ==")
+            BENCHMARKS[name]()
+        return
+
+    unknown = [name for name in args.names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"scénario inconnu : {', '.join(unknown)} (disponibles : {', '.join(SCENARIOS)})")
+    # Avec --json -, la sortie standard ne reçoit que le JSON : tout le reste part sur stderr
+    output = sys.stdout
+    if args.json == '-':
+        sys.stdout = sys.stderr
+    results = run_scenarios(args.names or list(SCENARIOS), args.scale)
+    write_report({'version': 1, 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                  'environment': environment(), 'scenarios': results}, args.json, output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
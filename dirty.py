@@ -0,0 +1,74 @@
+"""
+Affichage par rectangles modifiés pour les menus et les écrans fixes
+L'écran est toujours composé en entier dans la surface d'affichage, mais seules les zones
+qui ont changé depuis la frame précédente sont envoyées à l'écran avec
+pygame.display.update(rects). Quand rien n'est animé, la boucle attend le prochain
+événement (wait_events) au lieu de redessiner 60 fois par seconde un écran identique.
+"""
+import pygame
+
+# Événements après lesquels la fenêtre doit être entièrement réaffichée
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+
+class DirtyRects:
+    def __init__(self):
+        self.full = True     # Premier affichage : toute la fenêtre
+        self.rects = []      # Zones à envoyer à l'écran pour cette frame
+        self.previous = {}   # clé -> (rectangle(s), état) de l'élément à la frame précédente
+        self.current = {}
+
+    def invalidate(self):
+        # Toute la fenêtre sera envoyée à la prochaine présentation (changement d'écran...)
+        self.full = True
+
+    def handle_event(self, event):
+        if event.type in EXPOSE_EVENTS:
+            self.invalidate()
+
+    def add(self, rect):
+        self.rects.append(pygame.Rect(rect))
+
+    def track(self, key, rect, state=None):
+        """
+        Élément dessiné pendant cette frame, identifié par key
+        Si son rectangle ou son état (texte, couleur...) a changé depuis la frame précédente,
+        l'ancienne et la nouvelle zone sont à mettre à jour
+        """
+        self.track_many(key, [pygame.Rect(rect)], state)
+
+    def track_many(self, key, rects, state=None):
+        # Comme track(), pour un groupe d'éléments qui bougent ensemble (particules...)
+        self.current[key] = (rects, state)
+        old = self.previous.get(key)
+        if old != (rects, state):
+            self.rects.extend(rects)
+            if old:
+                self.rects.extend(old[0])
+
+    def present(self):
+        """Envoie les zones modifiées à l'écran ; renvoie False si rien n'a changé"""
+        # Les éléments qui n'ont pas été redessinés ont disparu : leur ancienne zone est à effacer
+        for key, (rects, _) in self.previous.items():
+            if key not in self.current:
+                self.rects.extend(rects)
+        self.previous, self.current = self.current, {}
+
+        updated = self.full or bool(self.rects)
+        if self.full:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.rects)
+        self.full = False
+        self.rects = []
+        return updated
+
+
+def wait_events(timeout=0):
+    """
+    Attend le prochain événement (au plus timeout ms, 0 = sans limite)
+    et renvoie tous les événements en attente ; le processus dort pendant l'attente
+    """
+    event = pygame.event.wait(timeout) if timeout else pygame.event.wait()
+    events = [] if event.type == pygame.NOEVENT else [event]
+    return events + pygame.event.get()
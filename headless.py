@@ -0,0 +1,179 @@
+"""
+Simulation sans fenêtre des deux modes de jeu (profilage, tests d'endurance)
+Aucune image n'est décodée, le temps de jeu avance d'un pas de simulation à la fois
+et les entrées viennent d'un script au lieu de la souris et du clavier.
+Usage : python headless.py classic|arcade [--games N] [--seed N] [--difficulty D]
+"""
+import argparse
+import os
+import random
+import time
+
+# Pilotes SDL factices : à définir avant le premier import de pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from timestep import SIMULATION_RATE, SimulationClock, use_clock
+
+CLASSIC_MAX_STEPS = SIMULATION_RATE * 60 * 5  # 5 minutes de jeu au plus
+
+_classic = None
+_arcade = None
+
+
+def classic_module():
+    # Le mode Classic est importé (et ses assets remplacés) au premier besoin
+    global _classic
+    if _classic is None:
+        import main1
+        main1.AssetLoader.load_placeholders()
+        _classic = main1
+    return _classic
+
+
+def arcade_module():
+    global _arcade
+    if _arcade is None:
+        import main4
+        main4.assets.use_placeholders()
+        _arcade = main4
+    return _arcade
+
+
+def classic_bot(rng):
+    """
+    Script d'entrées du mode Classic : un coup de lame horizontal vers un fruit toutes les
+    20 pas, et de temps en temps la touche d'un fruit
+    Renvoie inputs(step, game) -> liste de (action, valeur), action parmi
+    'down' (position), 'move' (position), 'up' (None) et 'key' (touche pygame)
+    """
+    swipe = []
+
+    def inputs(step, game):
+        actions = []
+        if swipe:
+            actions.append(swipe.pop(0))
+        elif step % 20 == 0:
+            fruits = [obj for obj in game.objects if obj.object_type == 'fruit' and not obj.sliced]
+            if fruits:
+                target = rng.choice(fruits)
+                y = target.y + rng.uniform(-20, 20)
+                start_x = target.x - 150
+                actions.append(('down', (start_x, y)))
+                swipe.extend(('move', (start_x + 50 * i, y)) for i in range(1, 7))
+                swipe.append(('up', None))
+        if step % 45 == 0:
+            game_keys = [obj.key for obj in game.objects if obj.object_type == 'fruit' and not obj.sliced]
+            if game_keys:
+                actions.append(('key', rng.choice(game_keys)))
+        return actions
+
+    return inputs
+
+
+def run_classic(inputs=None, seed=0, difficulty='moyen', max_steps=CLASSIC_MAX_STEPS):
+    """Joue une partie du mode Classic jusqu'au game over (ou max_steps pas)"""
+    main1 = classic_module()
+    inputs = inputs or classic_bot(random.Random(seed))
+    clock = SimulationClock()
+    use_clock(clock)
+    try:
+        game = main1.Game(difficulty=difficulty, player_name='bot',
+                          scoreboard=main1.Scoreboard(filename=None), seed=seed)
+        mouse_pos = (main1.WINDOW_WIDTH // 2, main1.WINDOW_HEIGHT // 2)
+        step = 0
+        while step < max_steps and not game.game_over:
+            for action, value in inputs(step, game):
+                if action in ('down', 'move'):
+                    mouse_pos = value
+                game.apply_input(action, value)
+            game.step(mouse_pos)
+            clock.tick()
+            step += 1
+        main1.slice_particles.clear()
+        game.release_objects()
+        return {'score': game.score, 'steps': step, 'strikes': game.strikes, 'game_over': game.game_over}
+    finally:
+        use_clock(None)
+
+
+def arcade_bot(rng):
+    """
+    Script d'entrées du mode Arcade : le vaisseau se place sous le fruit le plus proche et tire
+    Renvoie inputs(step, player) -> {'left': bool, 'right': bool, 'shoot': bool}
+    """
+    main4 = arcade_module()
+
+    def inputs(step, player):
+        fruits = [obj for obj in main4.objects if obj.type == 'fruit']
+        center = player.x + player.width / 2
+        if not fruits:
+            return {'left': False, 'right': False, 'shoot': False}
+        target = min(fruits, key=lambda obj: abs(obj.rect.centerx - center))
+        offset = target.rect.centerx - center
+        return {
+            'left': offset < -main4.player_speed,
+            'right': offset > main4.player_speed,
+            'shoot': abs(offset) < target.width / 2 and step % 10 == 0 and rng.random() < 0.8,
+        }
+
+    return inputs
+
+
+def run_arcade(inputs=None, seed=0, difficulty='easy', max_steps=None):
+    """Joue une manche du mode Arcade jusqu'à la fin du temps ou au game over"""
+    main4 = arcade_module()
+    main4.rng.seed(seed)
+    inputs = inputs or arcade_bot(random.Random(seed))
+    clock = SimulationClock()
+    use_clock(clock)
+    try:
+        main4.current_difficulty = difficulty
+        main4.reset_game_state()
+        main4.last_spawn_time = 0
+        player = main4.Player()
+        step = 0
+        while clock.ticks() < main4.ROUND_DURATION and not main4.game_over and step != max_steps:
+            main4.spawn_if_due(clock.ticks())
+            pressed = inputs(step, player)
+            if pressed['shoot']:
+                main4.shoot_weapon(player)
+            main4.step_game(player, {pygame.K_LEFT: pressed['left'], pygame.K_RIGHT: pressed['right']})
+            clock.tick()
+            step += 1
+        return {'score': main4.score, 'steps': step, 'game_over': main4.game_over}
+    finally:
+        use_clock(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parties simulées sans fenêtre")
+    parser.add_argument('mode', choices=['classic', 'arcade'])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--difficulty', default=None)
+    args = parser.parse_args()
+
+    if args.mode == 'classic':
+        run = lambda seed: run_classic(seed=seed, difficulty=args.difficulty or 'moyen')
+        classic_module()
+    else:
+        run = lambda seed: run_arcade(seed=seed, difficulty=args.difficulty or 'easy')
+        arcade_module()
+
+    start = time.perf_counter()
+    results = [run(args.seed + i) for i in range(args.games)]
+    elapsed = time.perf_counter() - start
+
+    steps = sum(result['steps'] for result in results)
+    scores = [result['score'] for result in results]
+    print(f"{args.games} parties {args.mode} en {elapsed:.2f} s "
+          f"({args.games / elapsed * 60:.0f} parties/min, {steps / elapsed:.0f} pas/s)")
+    print(f"Score moyen {sum(scores) / len(scores):.1f}, min {min(scores)}, max {max(scores)}, "
+          f"game over {sum(result['game_over'] for result in results)}/{len(results)}")
+
+
+if __name__ == "__main__":
+    main()
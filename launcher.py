@@ -1,9 +1,13 @@
 import pygame
 import sys
 import os
-import subprocess
 import math
 import random
+from particles import ParticleSystem
+from layers import flatten_layers
+from profiler import FrameProfiler
+from dirty import DirtyRects
+from scenes import run_scene
 
 # Initialisation de Pygame
 pygame.init()
@@ -15,6 +19,9 @@ HEIGHT = 720
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Fruit Slicer - Launcher")
 
+# Profileur de frames (F3)
+profiler = FrameProfiler('launcher')
+
 # Couleurs
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -28,31 +35,20 @@ title_font = pygame.font.Font(None, 72)
 menu_font = pygame.font.Font(None, 48)
 credit_font = pygame.font.Font(None, 36)
 
-# Classe pour les particules
-class Particle:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.size = random.randint(2, 4)
-        self.color = random.choice([NEON_BLUE, NEON_PINK, NEON_GREEN, NEON_PURPLE])
-        self.speed = random.uniform(1, 3)
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.life = 255
+# Particules néon : pas de gravité, durée de vie 255 qui diminue de 5 par frame
+PARTICLE_COLORS = [NEON_BLUE, NEON_PINK, NEON_GREEN, NEON_PURPLE]
 
-    def update(self):
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
-        self.life -= 5
-        self.size = max(0, self.size - 0.1)
+def make_particles(capacity):
+    return ParticleSystem(capacity=capacity, gravity=0, shrink=0.1, decay=5)
 
-    def draw(self, surface):
-        if self.life > 0:
-            alpha = min(255, self.life)
-            color = (*self.color, alpha)
-            pygame.draw.circle(surface, color, (int(self.x), int(self.y)), int(self.size))
+def emit_particles(system, xs, ys):
+    system.emit(xs, ys, len(xs), PARTICLE_COLORS, speed=(1, 3), size=(2, 4), lifetime=255)
 
 # Classe pour les boutons animés
 class AnimatedButton:
+    # Surfaces de lueur déjà construites : (couleur, taille, intensité) -> surface
+    glow_cache = {}
+
     def __init__(self, x, y, width, height, text, color):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
@@ -60,41 +56,51 @@ class AnimatedButton:
         self.is_hovered = False
         self.animation_offset = 0
         self.glow_intensity = 0
-        self.particles = []
+        self.particles = make_particles(256)
+        self.text_surface = menu_font.render(self.text, True, WHITE)
+
+    def glow_surface(self):
+        # L'intensité varie par paliers de 5 : au plus 21 surfaces par couleur de bouton
+        key = (self.color, self.rect.size, int(self.glow_intensity))
+        surface = AnimatedButton.glow_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.rect.width + 20, self.rect.height + 20), pygame.SRCALPHA)
+            pygame.draw.rect(surface, (*self.color, key[2]), (10, 10, self.rect.width, self.rect.height), border_radius=10)
+            AnimatedButton.glow_cache[key] = surface
+        return surface
 
     def draw(self, surface):
-        # Effet de lueur
-        glow_surface = pygame.Surface((self.rect.width + 20, self.rect.height + 20), pygame.SRCALPHA)
-        glow_color = (*self.color, int(self.glow_intensity))
-        pygame.draw.rect(glow_surface, glow_color, (10, 10, self.rect.width, self.rect.height), border_radius=10)
-        surface.blit(glow_surface, (self.rect.x - 10, self.rect.y - 10))
+        # Effet de lueur (invisible à intensité nulle)
+        if self.glow_intensity > 0:
+            surface.blit(self.glow_surface(), (self.rect.x - 10, self.rect.y - 10))
 
         # Bouton principal
         pygame.draw.rect(surface, self.color, self.rect, border_radius=10)
         pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=10)
 
         # Texte avec animation
-        text_surface = menu_font.render(self.text, True, WHITE)
-        text_rect = text_surface.get_rect(center=self.rect.center)
+        text_rect = self.text_surface.get_rect(center=self.rect.center)
         text_rect.y += math.sin(self.animation_offset) * 2
-        surface.blit(text_surface, text_rect)
+        surface.blit(self.text_surface, text_rect)
+        self.text_y = text_rect.y
 
         # Particules
-        for particle in self.particles[:]:
-            particle.update()
-            particle.draw(surface)
-            if particle.life <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
+        self.particles.draw(surface)
+
+    def mark_dirty(self, dirty):
+        # Zones du bouton qui ont changé : texte qui flotte, lueur et particules
+        dirty.track(self.text, self.rect.inflate(20, 20), (self.text_y, self.glow_intensity))
+        dirty.track_many((self.text, 'particules'), self.particles.rects())
 
     def update(self):
         self.animation_offset += 0.1
         if self.is_hovered:
             self.glow_intensity = min(100, self.glow_intensity + 5)
             if random.random() < 0.1:
-                self.particles.append(Particle(
-                    random.randint(self.rect.left, self.rect.right),
-                    random.randint(self.rect.top, self.rect.bottom)
-                ))
+                emit_particles(self.particles,
+                               [random.randint(self.rect.left, self.rect.right)],
+                               [random.randint(self.rect.top, self.rect.bottom)])
         else:
             self.glow_intensity = max(0, self.glow_intensity - 5)
 
@@ -111,74 +117,123 @@ classic_button = AnimatedButton(WIDTH//2 - 200, HEIGHT//2 - 100, 400, 80, "Fruit
 arcade_button = AnimatedButton(WIDTH//2 - 200, HEIGHT//2 + 20, 400, 80, "Fruit Slicer Arcade", NEON_PINK)
 quit_button = AnimatedButton(WIDTH//2 - 200, HEIGHT//2 + 140, 400, 80, "Quitter", NEON_PURPLE)
 
-# Particules de fond
-background_particles = [Particle(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(50)]
+# Particules de fond : toujours 50 particules visibles
+BACKGROUND_PARTICLES = 50
+background_particles = make_particles(BACKGROUND_PARTICLES)
+
+def respawn_background_particles():
+    missing = BACKGROUND_PARTICLES - background_particles.count()
+    if missing > 0:
+        emit_particles(background_particles,
+                       [random.randint(0, WIDTH) for _ in range(missing)],
+                       [random.randint(0, HEIGHT) for _ in range(missing)])
+
+respawn_background_particles()
+
+# Titre avec effet de lueur : composé une fois au lancement au lieu de 5 surfaces et 6 rendus par frame
+# TITLE_GLOW_FRAMES=N (N > 1) : la lueur pulse en boucle sur N images pré-rendues
+TITLE_GLOW_FRAMES = max(1, int(os.environ.get('TITLE_GLOW_FRAMES', 1)))
+TITLE_FRAME_TICKS = 4  # Frames d'affichage de chaque image de la pulsation
+
+def build_title(text, strength=1.0):
+    # Titre blanc sur 5 halos néon ; strength règle l'opacité des halos
+    title = title_font.render(text, True, WHITE)
+    margin = 10  # Débord du plus grand halo
+    title_pos = (margin, margin)
+    layers = []
+    for offset in range(5, 0, -1):
+        glow_color = (*NEON_BLUE, 50 - offset * 10)
+        glow_surface = pygame.Surface((title.get_width() + offset * 4, title.get_height() + offset * 4), pygame.SRCALPHA)
+        glow_title = title_font.render(text, True, glow_color)
+        glow_rect = glow_title.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
+        glow_surface.blit(glow_title, glow_rect)
+        layers.append((glow_surface, (margin - offset * 2, margin - offset * 2), strength))
+    layers.append((title, title_pos, 1.0))
+    return flatten_layers((title.get_width() + margin * 2, title.get_height() + margin * 2), layers)
+
+if TITLE_GLOW_FRAMES > 1:
+    title_frames = [build_title("FRUIT SLICER", 0.6 + 0.4 * math.cos(2 * math.pi * i / TITLE_GLOW_FRAMES))
+                    for i in range(TITLE_GLOW_FRAMES)]
+else:
+    title_frames = [build_title("FRUIT SLICER")]
+title_rect = title_frames[0].get_rect(center=(WIDTH//2, 100))
+
+# Crédits : texte fixe
+credits = credit_font.render("Présenté par Adam, Redha et Pierre", True, NEON_GREEN)
+credits_rect = credits.get_rect(bottomright=(WIDTH - 20, HEIGHT - 20))
 
 # Boucle principale
 running = True
 clock = pygame.time.Clock()
+frame_count = 0
+# Les crédits ne bougent pas : seuls les boutons, les particules et le titre s'il pulse sont réaffichés
+dirty = DirtyRects()
+profiler.begin_frame()
 
 while running:
     screen.fill(BLACK)
     
     # Mise à jour et affichage des particules de fond
-    for particle in background_particles[:]:
-        particle.update()
-        particle.draw(screen)
-        if particle.life <= 0:
-            background_particles.remove(particle)
-            background_particles.append(Particle(random.randint(0, WIDTH), random.randint(0, HEIGHT)))
+    background_particles.update()
+    background_particles.draw(screen)
+    dirty.track_many('particules', background_particles.rects())
+    respawn_background_particles()
+    profiler.mark('background')
 
     # Affichage du titre avec effet de lueur
-    title = title_font.render("FRUIT SLICER", True, WHITE)
-    title_rect = title.get_rect(center=(WIDTH//2, 100))
-    
-    # Effet de lueur pour le titre
-    for offset in range(5, 0, -1):
-        glow_color = (*NEON_BLUE, 50 - offset * 10)
-        glow_surface = pygame.Surface((title_rect.width + offset * 4, title_rect.height + offset * 4), pygame.SRCALPHA)
-        glow_title = title_font.render("FRUIT SLICER", True, glow_color)
-        glow_rect = glow_title.get_rect(center=(glow_surface.get_width()//2, glow_surface.get_height()//2))
-        glow_surface.blit(glow_title, glow_rect)
-        screen.blit(glow_surface, (title_rect.x - offset * 2, title_rect.y - offset * 2))
-    
-    screen.blit(title, title_rect)
+    title_frame = frame_count // TITLE_FRAME_TICKS % len(title_frames)
+    screen.blit(title_frames[title_frame], title_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+    dirty.track('titre', title_rect, title_frame)
+    frame_count += 1
+    profiler.mark('title')
 
     # Mise à jour et affichage des boutons
     classic_button.update()
     arcade_button.update()
     quit_button.update()
+    profiler.mark('update')
     
     classic_button.draw(screen)
     arcade_button.draw(screen)
     quit_button.draw(screen)
+    for button in (classic_button, arcade_button, quit_button):
+        button.mark_dirty(dirty)
+    profiler.mark('buttons')
 
     # Crédits
-    credits = credit_font.render("Présenté par Adam, Redha et Pierre", True, NEON_GREEN)
-    credits_rect = credits.get_rect(bottomright=(WIDTH - 20, HEIGHT - 20))
     screen.blit(credits, credits_rect)
+    profiler.mark('hud')
     
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
+        if profiler.handle_event(event):
+            dirty.invalidate()  # Overlay du profileur affiché ou retiré
+            continue
+        dirty.handle_event(event)
             
+        # Le mode de jeu tourne dans la même fenêtre et revient ici quand le joueur le ferme
         if classic_button.handle_event(event):
-            pygame.quit()
-            subprocess.run([sys.executable, "main1.py"])
-            pygame.init()
-            screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            run_scene('classic')
+            dirty.invalidate()
             
         if arcade_button.handle_event(event):
-            pygame.quit()
-            subprocess.run([sys.executable, "main4.py"])
-            pygame.init()
-            screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            run_scene('arcade')
+            dirty.invalidate()
             
         if quit_button.handle_event(event):
             running = False
+    profiler.mark('events')
     
-    pygame.display.flip()
+    profiler.draw(screen)
+    profiler.mark('overlay')
+    if profiler.visible:
+        dirty.invalidate()
+    dirty.present()
+    profiler.mark('flip')
     clock.tick(60)
+    profiler.mark('idle')
+    profiler.end_frame()
 
 pygame.quit()
 sys.exit() 
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Calques composés une seule fois puis affichés d'un seul blit (titre du lanceur, HUD Arcade)
+Plusieurs surfaces SRCALPHA superposées dans un calque SRCALPHA ordinaire perdraient leurs
+bords anticrénelés (le fond transparent assombrit les pixels semi-transparents) : le calque
+est donc composé en NumPy, aux couleurs prémultipliées.
+"""
+import numpy as np
+import pygame
+
+
+def flatten_layers(size, layers):
+    """
+    Superpose des surfaces SRCALPHA dans un seul calque, aux couleurs prémultipliées
+    layers: (surface, position, opacité) dans l'ordre d'affichage
+    Affiché avec special_flags=pygame.BLEND_PREMULTIPLIED, le calque donne le même résultat
+    que les blits successifs des surfaces, quel que soit le fond
+    """
+    color = np.zeros((*size, 3))
+    alpha = np.zeros(size)
+    for surface, (x, y), opacity in layers:
+        width, height = surface.get_size()
+        area = (slice(x, x + width), slice(y, y + height))
+        source_alpha = pygame.surfarray.array_alpha(surface) / 255 * opacity
+        source = pygame.surfarray.array3d(surface) * source_alpha[..., None]
+        color[area] = source + color[area] * (1 - source_alpha[..., None])
+        alpha[area] = source_alpha + alpha[area] * (1 - source_alpha)
+    layer = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(layer)[...] = np.round(color).astype(np.uint8)
+    pygame.surfarray.pixels_alpha(layer)[...] = np.round(alpha * 255).astype(np.uint8)
+    return layer
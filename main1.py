@@ -5,11 +5,23 @@ import math
 import numpy as np
 from pygame import mixer
 from PIL import Image
+from preloader import AssetPreloader
+from particles import ParticleSystem
+from timestep import FixedTimestep, RENDER_FPS, SimulationClock, lerp, get_ticks, use_clock
+from replay import Replay
+from profiler import FrameProfiler
+from dirty import DirtyRects, wait_events
+from scenes import quit_scene
+from pools import ObjectPool, pause_gc, resume_gc
 import json
 import gettext
 import locale
 import os
 import datetime
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
 
 # Initialisation de Pygame
 pygame.init()
@@ -21,12 +33,93 @@ WINDOW_HEIGHT = 920
 screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Ninja Slicer")
 
+# Cache des sprites tournés
+ROTATION_STEP = 5                          # Pas de quantification des angles (degrés)
+ROTATION_CACHE_BUDGET = 64 * 1024 * 1024   # Mémoire maximale du cache (octets)
+
+# Taille des cellules de la grille de détection des coupes (pixels)
+GRID_CELL_SIZE = 128
+# Distance minimale parcourue par la lame en une frame pour couper (pixels)
+MIN_BLADE_DISTANCE = 5
+
+# Cache des textes
+TEXT_CACHE_SIZE = 512  # Nombre maximal de textes rendus gardés en mémoire
+
 # Couleurs
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 RED = (255, 0, 0)
 BLUE = (0, 0, 255)
 
+# Cache disque des sprites déjà traités (détourés, découpés, redimensionnés)
+class SpriteCache:
+    VERSION = 1  # À incrémenter si le traitement des images change
+    HEADER = struct.Struct('<4sII4s')  # signature, largeur, hauteur, format des pixels
+    MAGIC = b'SPRC'
+
+    def __init__(self, cache_dir='.sprite_cache'):
+        self.cache_dir = cache_dir
+        self.file_hashes = {}  # Hash du contenu de chaque fichier source
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()  # Le cache est utilisé depuis les threads de chargement
+
+    def file_hash(self, path):
+        if path not in self.file_hashes:
+            with open(path, 'rb') as f:
+                self.file_hashes[path] = hashlib.sha1(f.read()).hexdigest()
+        return self.file_hashes[path]
+
+    def key(self, source_paths, params):
+        # La clé change dès que le contenu d'une source ou un paramètre change
+        digest = hashlib.sha1(repr((SpriteCache.VERSION, params)).encode())
+        for path in source_paths:
+            digest.update(self.file_hash(path).encode())
+        return digest.hexdigest()
+
+    def load(self, key):
+        path = os.path.join(self.cache_dir, key + '.raw')
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()  # Une seule lecture : en-tête + pixels
+            magic, width, height, fmt = SpriteCache.HEADER.unpack_from(data)
+            if magic != SpriteCache.MAGIC:
+                return None
+            pixels = memoryview(data)[SpriteCache.HEADER.size:]
+            # La conversion au format de l'écran est faite par l'appelant (thread principal)
+            return pygame.image.frombuffer(pixels, (width, height), fmt.decode().rstrip('\0'))
+        except (OSError, ValueError, struct.error, pygame.error):
+            return None
+
+    def save(self, key, surface, alpha=True):
+        fmt = 'RGBA' if alpha else 'RGB'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            header = SpriteCache.HEADER.pack(SpriteCache.MAGIC, *surface.get_size(), fmt.encode().ljust(4, b'\0'))
+            # Écriture dans un fichier temporaire pour ne jamais laisser un cache à moitié écrit
+            path = os.path.join(self.cache_dir, key + '.raw')
+            with open(path + '.tmp', 'wb') as f:
+                f.write(header)
+                f.write(pygame.image.tostring(surface, fmt))
+            os.replace(path + '.tmp', path)
+        except (OSError, pygame.error) as e:
+            print(f"Erreur d'écriture du cache de sprites: {e}")
+
+    def get(self, source_paths, params, build, alpha=True):
+        # Renvoie le sprite depuis le cache, ou le construit avec build() puis le met en cache
+        key = self.key(source_paths, params)
+        surface = self.load(key)
+        with self.lock:
+            if surface is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if surface is not None:
+            return surface
+        surface = build()
+        self.save(key, surface, alpha)
+        return surface
+
 # Chargement des images (à remplacer par vos propres assets)
 class AssetLoader:
     FRUITS = ['apple', 'banana', 'watermelon', 'pineapple']
@@ -34,7 +127,10 @@ class AssetLoader:
     SLICED_IMAGES_LEFT = {}
     SLICED_IMAGES_RIGHT = {}
     SOUNDS = {}
-    
+    sprite_cache = SpriteCache()
+    load_time = 0  # Durée du dernier chargement, en secondes
+    loaded = False  # Vrai seulement quand load_assets() (ou load_placeholders()) est allé au bout
+
     # Déplacer les ratios ici, à l'intérieur de la classe
     fruit_cut_ratios = {
         'apple': 0.52,      # La lame est légèrement décalée vers la droite
@@ -42,42 +138,68 @@ class AssetLoader:
         'watermelon': 0.51, # La lame est presque au milieu
         'pineapple': 0.49   # La lame est légèrement décalée vers la gauche
     }
-    
+
+    # Paramètres de suppression du fond pour chaque fruit
+    # None = l'image est déjà transparente, aucun traitement
+    # color_keys : liste de (couleur RGB, tolérance) à rendre transparentes en plus des seuils
+    background_keys = {
+        'apple': None,
+        'banana': None,
+        'watermelon': None,
+        'pineapple': {
+            'white_threshold': 230,  # Fond blanc
+            'brown_threshold': 30,   # Fond marron foncé
+            'color_keys': []
+        }
+    }
+
     @staticmethod
-    def remove_background(image_path):
-        # Ouvre l'image avec PIL
+    def key_image(img, white_threshold=230, brown_threshold=30, color_keys=()):
+        """
+        Rend transparents les pixels du fond d'une image PIL en une seule opération NumPy
+        white_threshold / brown_threshold: seuils sur R, G et B (None pour désactiver)
+        color_keys: couleurs supplémentaires à supprimer, sous la forme (couleur RGB, tolérance)
+        """
+        pixels = np.array(img.convert("RGBA"))
+        rgb = pixels[..., :3]
+
+        # Masque des pixels à rendre transparents
+        mask = np.zeros(rgb.shape[:2], dtype=bool)
+        if white_threshold is not None:
+            mask |= (rgb > white_threshold).all(axis=-1)  # Proche du blanc
+        if brown_threshold is not None:
+            mask |= (rgb < brown_threshold).all(axis=-1)  # Marron foncé
+        for color, tolerance in color_keys:
+            distance = np.abs(rgb.astype(np.int16) - np.array(color, dtype=np.int16))
+            mask |= (distance <= tolerance).all(axis=-1)
+
+        pixels[mask] = (255, 255, 255, 0)  # Transparent
+        return Image.fromarray(pixels, "RGBA")
+
+    @staticmethod
+    def remove_background(image_path, white_threshold=230, brown_threshold=30, color_keys=()):
+        # Ouvre l'image avec PIL et supprime le fond
         img = Image.open(image_path)
-        img = img.convert("RGBA")
-        
-        # Obtient les données des pixels
-        datas = img.getdata()
-        
-        # Crée une nouvelle liste de pixels
-        new_data = []
-        
-        # Définit les seuils (ajustés pour l'ananas)
-        white_threshold = 230
-        brown_threshold = 30  # Pour détecter le fond marron
-        
-        for item in datas:
-            # Si le pixel est proche du blanc OU si c'est un marron foncé
-            if (item[0] > white_threshold and item[1] > white_threshold and item[2] > white_threshold) or \
-               (item[0] < brown_threshold and item[1] < brown_threshold and item[2] < brown_threshold):
-                new_data.append((255, 255, 255, 0))  # Transparent
-            else:
-                new_data.append(item)  # Garde la couleur d'origine
-                
-        # Met à jour l'image avec les nouveaux pixels
-        img.putdata(new_data)
-        return img
-    
+        return AssetLoader.key_image(img, white_threshold, brown_threshold, color_keys)
+
+    @staticmethod
+    def load_fruit_surface(image_path, background_key=None):
+        # Charge une image de fruit, en supprimant le fond si nécessaire
+        if background_key is None:
+            return pygame.image.load(image_path)
+        pil_img = AssetLoader.remove_background(image_path, **background_key)
+        return pygame.image.fromstring(pil_img.tobytes(), pil_img.size, pil_img.mode)
+
     @staticmethod
-    def create_fruit_halves(sliced_path, cut_ratio=0.5):
+    def create_fruit_halves(sliced_path, cut_ratio=0.5, background_key=None):
         """
         Crée les deux moitiés d'un fruit à partir de l'image coupée
         cut_ratio: position de la coupe (0.5 = milieu, 0.4 = 40% depuis la gauche, etc.)
+        background_key: paramètres de suppression du fond (voir background_keys)
         """
         fruit_img = Image.open(sliced_path)
+        if background_key is not None:
+            fruit_img = AssetLoader.key_image(fruit_img, **background_key)
         width, height = fruit_img.size
         
         # Calculer le point de coupe en fonction du ratio
@@ -100,109 +222,158 @@ class AssetLoader:
         
         return left_surface, right_surface
     
+    # Autres images : attribut, fichier, taille, transparence
+    OTHER_IMAGES = [
+        ('BOMB_IMAGE', 'assets_fruits/nonfatalbomb.png', (120, 120), True),
+        ('BOMB_EFFECT', 'assets_fruits/boooomb.png', (200, 200), True),
+        ('ICE_IMAGE', 'assets_fruits/ice_cube.png', (120, 120), True),
+        ('ICE_TOP', 'assets_fruits/ice_cube_top.png', (120, 60), True),
+        ('ICE_BOTTOM', 'assets_fruits/ice_cube_bottom.png', (120, 60), True),
+        ('KNIFE_IMAGE', 'assets_fruits/knife.png', (100, 100), True),
+        ('BACKGROUND', 'assets_fruits/background.jpg', (WINDOW_WIDTH, WINDOW_HEIGHT), False),
+        ('SPEAKER_ON', 'assets_fruits/speaker_on_remoove.png', (60, 60), True),
+        ('SPEAKER_OFF', 'assets_fruits/speaker_off-remove.png', (60, 60), True)
+    ]
+
+    SOUND_FILES = {
+        'slice': ('assets_fruits/knife_cut.mp3', 1.0),
+        'game_over': ('assets_fruits/gameOver.mp3', 1.0)
+    }
+
+    # Les fonctions load_* peuvent tourner dans un thread : elles ne font jamais de convert()
+
+    @staticmethod
+    def fruit_paths(fruit):
+        if fruit == 'pineapple':
+            return 'assets_fruits/ananas.png', 'assets_fruits/ananas_sliced2.png'
+        return f'assets_fruits/{fruit.capitalize()}.png', f'assets_fruits/{fruit}sliced.png'
+
+    @staticmethod
+    def fruit_sizes(fruit):
+        # Taille du fruit entier et de chaque moitié
+        if fruit == 'pineapple':
+            return (150, 150), (75, 150)
+        return (130, 130), (65, 130)
+
+    @staticmethod
+    def load_fruit(fruit):
+        # Charge l'image normale (avec suppression du fond si configurée)
+        image_path, _ = AssetLoader.fruit_paths(fruit)
+        background_key = AssetLoader.background_keys.get(fruit)
+        size, _ = AssetLoader.fruit_sizes(fruit)
+        return AssetLoader.sprite_cache.get(
+            [image_path], ('fruit', background_key, size),
+            lambda: pygame.transform.scale(AssetLoader.load_fruit_surface(image_path, background_key), size)
+        )
+
+    @staticmethod
+    def load_fruit_halves(fruit):
+        # Crée les deux moitiés, avec le ratio de coupe spécifique à chaque fruit
+        _, sliced_path = AssetLoader.fruit_paths(fruit)
+        background_key = AssetLoader.background_keys.get(fruit)
+        cut_ratio = AssetLoader.fruit_cut_ratios.get(fruit, 0.5)
+        _, half_size = AssetLoader.fruit_sizes(fruit)
+
+        # Les deux moitiés ne sont découpées qu'une fois, et seulement si le cache est vide
+        halves = []
+        def build_half(index):
+            if not halves:
+                halves.extend(AssetLoader.create_fruit_halves(sliced_path, cut_ratio, background_key))
+            return pygame.transform.scale(halves[index], half_size)
+
+        return [
+            AssetLoader.sprite_cache.get(
+                [sliced_path], ('half', index, cut_ratio, background_key, half_size),
+                lambda index=index: build_half(index)
+            )
+            for index in range(2)
+        ]
+
+    @staticmethod
+    def load_scaled(image_path, size, alpha=True):
+        # Charge et redimensionne une image en passant par le cache disque
+        return AssetLoader.sprite_cache.get(
+            [image_path], ('scaled', size),
+            lambda: pygame.transform.scale(pygame.image.load(image_path), size),
+            alpha
+        )
+
+    @staticmethod
+    def store_fruit(fruit, surface):
+        AssetLoader.FRUIT_IMAGES[fruit] = surface.convert_alpha()
+
     @staticmethod
-    def load_assets():
-        # Charge les images des fruits normaux et coupés
+    def store_fruit_halves(fruit, halves):
+        AssetLoader.SLICED_IMAGES_LEFT[fruit] = halves[0].convert_alpha()
+        AssetLoader.SLICED_IMAGES_RIGHT[fruit] = halves[1].convert_alpha()
+
+    @staticmethod
+    def fruit_error(fruit, e):
+        print(f"Erreur de chargement pour {fruit}: {e}")
+        surface = pygame.Surface((100, 100), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 0, 0), (50, 50), 50)
+        AssetLoader.FRUIT_IMAGES[fruit] = surface
+        AssetLoader.SLICED_IMAGES_LEFT[fruit] = surface
+        AssetLoader.SLICED_IMAGES_RIGHT[fruit] = surface
+
+    @staticmethod
+    def store_sound(sound_name, volume, sound):
+        sound.set_volume(volume)
+        AssetLoader.SOUNDS[sound_name] = sound
+
+    @staticmethod
+    def load_assets(screen=None):
+        """
+        Charge tous les assets dans un pool de threads
+        screen: si fourni, affiche un écran de chargement avec la progression
+        """
+        preloader = AssetPreloader()
+
+        # Images des fruits normaux et coupés
         for fruit in AssetLoader.FRUITS:
-            try:
-                # Chargement du fruit normal
-                if fruit == 'pineapple':
-                    image_path = 'assets_fruits/ananas.png'
-                    sliced_path = 'assets_fruits/ananas_sliced2.png'
-                else:
-                    image_path = f'assets_fruits/{fruit.capitalize()}.png'
-                    sliced_path = f'assets_fruits/{fruit}sliced.png'
-                
-                # Charger l'image normale
-                if fruit == 'pineapple':
-                    # Suppression du fond pour l'ananas normal et coupé
-                    pil_img = AssetLoader.remove_background(image_path)
-                    mode = pil_img.mode
-                    size = pil_img.size
-                    data = pil_img.tobytes()
-                    img = pygame.image.fromstring(data, size, mode)
-                    
-                    # Même traitement pour l'ananas coupé
-                    pil_sliced = AssetLoader.remove_background(sliced_path)
-                    sliced_mode = pil_sliced.mode
-                    sliced_size = pil_sliced.size
-                    sliced_data = pil_sliced.tobytes()
-                    sliced_img = pygame.image.fromstring(sliced_data, sliced_size, sliced_mode)
-                else:
-                    img = pygame.image.load(image_path).convert_alpha()
-                sliced_img = pygame.image.load(sliced_path).convert_alpha()
-                
-                # Mettre à l'échelle l'image normale
-                if fruit == 'pineapple':
-                    AssetLoader.FRUIT_IMAGES[fruit] = pygame.transform.scale(img, (150, 150))
-                else:
-                    AssetLoader.FRUIT_IMAGES[fruit] = pygame.transform.scale(img, (130, 130))
-                
-                # Créer les deux moitiés
-                try:
-                    # Utiliser le ratio de coupe spécifique à chaque fruit
-                    cut_ratio = AssetLoader.fruit_cut_ratios.get(fruit, 0.5)
-                    left_img, right_img = AssetLoader.create_fruit_halves(sliced_path, cut_ratio)
-                    
-                    # Mettre à l'échelle les moitiés
-                    if fruit == 'pineapple':
-                        size = (75, 150)
-                    else:
-                        size = (65, 130)
-                        
-                    AssetLoader.SLICED_IMAGES_LEFT[fruit] = pygame.transform.scale(left_img, size)
-                    AssetLoader.SLICED_IMAGES_RIGHT[fruit] = pygame.transform.scale(right_img, size)
-                except Exception as e:
-                    print(f"Erreur lors de la découpe de {fruit}: {e}")
-                    
-            except Exception as e:
-                print(f"Erreur de chargement pour {fruit}: {e}")
-                surface = pygame.Surface((100, 100), pygame.SRCALPHA)
-                pygame.draw.circle(surface, (255, 0, 0), (50, 50), 50)
-                AssetLoader.FRUIT_IMAGES[fruit] = surface
-                AssetLoader.SLICED_IMAGES_LEFT[fruit] = surface
-                AssetLoader.SLICED_IMAGES_RIGHT[fruit] = surface
-        
-        # Enlever le chargement des assets manquants
-        try:
-            AssetLoader.BOMB_IMAGE = pygame.image.load('assets_fruits/nonfatalbomb.png').convert_alpha()
-            AssetLoader.BOMB_IMAGE = pygame.transform.scale(AssetLoader.BOMB_IMAGE, (120, 120))
-            
-            AssetLoader.BOMB_EFFECT = pygame.image.load('assets_fruits/boooomb.png').convert_alpha()
-            AssetLoader.BOMB_EFFECT = pygame.transform.scale(AssetLoader.BOMB_EFFECT, (200, 200))
-            
-            AssetLoader.ICE_IMAGE = pygame.image.load('assets_fruits/ice_cube.png').convert_alpha()
-            AssetLoader.ICE_IMAGE = pygame.transform.scale(AssetLoader.ICE_IMAGE, (120, 120))
-            
-            AssetLoader.ICE_TOP = pygame.image.load('assets_fruits/ice_cube_top.png').convert_alpha()
-            AssetLoader.ICE_TOP = pygame.transform.scale(AssetLoader.ICE_TOP, (120, 60))
-            
-            AssetLoader.ICE_BOTTOM = pygame.image.load('assets_fruits/ice_cube_bottom.png').convert_alpha()
-            AssetLoader.ICE_BOTTOM = pygame.transform.scale(AssetLoader.ICE_BOTTOM, (120, 60))
-            
-            AssetLoader.KNIFE_IMAGE = pygame.image.load('assets_fruits/knife.png').convert_alpha()
-            AssetLoader.KNIFE_IMAGE = pygame.transform.scale(AssetLoader.KNIFE_IMAGE, (100, 100))
-            
-            AssetLoader.BACKGROUND = pygame.image.load('assets_fruits/background.jpg').convert()
-            AssetLoader.BACKGROUND = pygame.transform.scale(AssetLoader.BACKGROUND, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        except Exception as e:
-            print(f"Erreur de chargement des autres assets: {e}")
-        
+            preloader.add(
+                fruit,
+                lambda fruit=fruit: AssetLoader.load_fruit(fruit),
+                lambda surface, fruit=fruit: AssetLoader.store_fruit(fruit, surface),
+                lambda e, fruit=fruit: AssetLoader.fruit_error(fruit, e)
+            )
+            preloader.add(
+                f'{fruit} (découpe)',
+                lambda fruit=fruit: AssetLoader.load_fruit_halves(fruit),
+                lambda halves, fruit=fruit: AssetLoader.store_fruit_halves(fruit, halves),
+                lambda e, fruit=fruit: print(f"Erreur lors de la découpe de {fruit}: {e}")
+            )
+
+        # Bombe, glaçon, couteau, fond et haut-parleur
+        for attribute, image_path, size, alpha in AssetLoader.OTHER_IMAGES:
+            preloader.add(
+                attribute,
+                lambda image_path=image_path, size=size, alpha=alpha: AssetLoader.load_scaled(image_path, size, alpha),
+                lambda surface, attribute=attribute, alpha=alpha: setattr(
+                    AssetLoader, attribute, surface.convert_alpha() if alpha else surface.convert()
+                ),
+                lambda e, image_path=image_path: print(f"Erreur de chargement de {image_path}: {e}")
+            )
+
         # Charger les sons
         AssetLoader.SOUNDS = {}
-        sound_files = {
-            'slice': ('assets_fruits/knife_cut.mp3', 1.0),
-            'game_over': ('assets_fruits/gameOver.mp3', 1.0)
-        }
-        
-        for sound_name, (file_path, volume) in sound_files.items():
-            try:
-                sound = pygame.mixer.Sound(file_path)
-                sound.set_volume(volume)
-                AssetLoader.SOUNDS[sound_name] = sound
-            except Exception as e:
-                print(f"Erreur de chargement du son {sound_name}: {e}")
-        
+        for sound_name, (file_path, volume) in AssetLoader.SOUND_FILES.items():
+            preloader.add(
+                sound_name,
+                lambda file_path=file_path: pygame.mixer.Sound(file_path),
+                lambda sound, sound_name=sound_name, volume=volume: AssetLoader.store_sound(sound_name, volume, sound),
+                lambda e, sound_name=sound_name: print(f"Erreur de chargement du son {sound_name}: {e}")
+            )
+
+        # Fenêtre fermée pendant le chargement : run() quitte, loaded reste faux et tout sera rechargé
+        AssetLoader.load_time = preloader.run(screen)
+
+        # Lettres des touches rendues une fois pour toutes
+        AssetLoader.KEY_LABELS = KeyLabelAtlas(GameObject.FRUIT_KEYS + [GameObject.BOMB_KEY, GameObject.ICE_KEY])
+        AssetLoader.loaded = True
+
+    @staticmethod
+    def play_music():
         # Charger et démarrer la musique de fond
         try:
             pygame.mixer.music.load('assets_fruits/ambiance_zik1h.mp3')
@@ -210,19 +381,28 @@ class AssetLoader:
             pygame.mixer.music.play(-1)  # -1 pour boucle infinie
         except Exception as e:
             print(f"Erreur de chargement de la musique: {e}")
-        
-        # Charger les images du haut-parleur
-        try:
-            AssetLoader.SPEAKER_ON = pygame.image.load('assets_fruits/speaker_on_remoove.png').convert_alpha()
-            AssetLoader.SPEAKER_OFF = pygame.image.load('assets_fruits/speaker_off-remove.png').convert_alpha()
-            AssetLoader.SPEAKER_ON = pygame.transform.scale(AssetLoader.SPEAKER_ON, (60, 60))
-            AssetLoader.SPEAKER_OFF = pygame.transform.scale(AssetLoader.SPEAKER_OFF, (60, 60))
-        except Exception as e:
-            print(f"Erreur de chargement des images du haut-parleur: {e}")
-    
+
+    @staticmethod
+    def load_placeholders():
+        """
+        Remplace tous les assets par des surfaces vides aux bonnes dimensions et des sons muets,
+        sans décoder aucun fichier (simulation sans fenêtre)
+        """
+        for fruit in AssetLoader.FRUITS:
+            size, half_size = AssetLoader.fruit_sizes(fruit)
+            AssetLoader.FRUIT_IMAGES[fruit] = pygame.Surface(size, pygame.SRCALPHA)
+            AssetLoader.SLICED_IMAGES_LEFT[fruit] = pygame.Surface(half_size, pygame.SRCALPHA)
+            AssetLoader.SLICED_IMAGES_RIGHT[fruit] = pygame.Surface(half_size, pygame.SRCALPHA)
+        for attribute, _, size, alpha in AssetLoader.OTHER_IMAGES:
+            setattr(AssetLoader, attribute, pygame.Surface(size, pygame.SRCALPHA if alpha else 0))
+        AssetLoader.SOUNDS = {name: pygame.mixer.Sound(buffer=bytes(4)) for name in AssetLoader.SOUND_FILES}
+        AnimatedHeart.FRAMES = [pygame.Surface((120, 120), pygame.SRCALPHA)]
+        AssetLoader.KEY_LABELS = KeyLabelAtlas(GameObject.FRUIT_KEYS + [GameObject.BOMB_KEY, GameObject.ICE_KEY])
+        AssetLoader.loaded = True
+
     @staticmethod
-    def get_random_fruit_image():
-        if not AssetLoader.FRUIT_IMAGES:
+    def get_random_fruit_image(rng=random):
+        if not AssetLoader.loaded:
             AssetLoader.load_assets()
         # Définir des poids pour chaque fruit
         weights = {
@@ -231,53 +411,189 @@ class AssetLoader:
             'watermelon': 0.25,
             'pineapple': 0.25  # Même probabilité pour l'ananas
         }
-        fruit = random.choices(AssetLoader.FRUITS, weights=[weights[f] for f in AssetLoader.FRUITS])[0]
+        fruit = rng.choices(AssetLoader.FRUITS, weights=[weights[f] for f in AssetLoader.FRUITS])[0]
         return AssetLoader.FRUIT_IMAGES[fruit], fruit
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(2, 5)
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 5)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.lifetime = 30
+# Cache LRU des sprites tournés, pour ne pas appeler pygame.transform.rotate à chaque frame
+class RotationCache:
+    def __init__(self, step=ROTATION_STEP, memory_budget=ROTATION_CACHE_BUDGET):
+        self.step = step
+        self.memory_budget = memory_budget
+        self.cache = OrderedDict()  # (surface, angle) -> surface tournée
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1  # Gravité
-        self.lifetime -= 1
-        self.size = max(0, self.size - 0.1)
+    def rotate(self, surface, angle):
+        # Angle arrondi au pas le plus proche, ramené entre 0 et 360
+        angle = (round(angle / self.step) * self.step) % 360
+        key = (surface, angle)
+        rotated = self.cache.get(key)
+        if rotated is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return rotated
 
-    def draw(self, screen):
-        if self.lifetime > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
+        self.misses += 1
+        rotated = pygame.transform.rotate(surface, angle)
+        self.cache[key] = rotated
+        self.memory += self.surface_size(rotated)
+
+        # Supprimer les sprites les moins utilisés si on dépasse le budget
+        while self.memory > self.memory_budget and len(self.cache) > 1:
+            _, old = self.cache.popitem(last=False)
+            self.memory -= self.surface_size(old)
+        return rotated
+
+    @staticmethod
+    def surface_size(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def report(self):
+        return (f"Cache de rotation: {self.hit_rate() * 100:.1f}% de hits, "
+                f"{len(self.cache)} sprites, {self.memory / (1024 * 1024):.1f} Mo")
+
+rotation_cache = RotationCache()
+
+# Rendu de texte avec réutilisation des polices et des surfaces déjà rendues
+class TextRenderer:
+    def __init__(self, max_surfaces=TEXT_CACHE_SIZE):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}  # (police, taille) -> pygame.font.Font
+        self.surfaces = OrderedDict()  # (texte, taille, couleur, contour, police) -> surface
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, face=None):
+        key = (face, size)
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.Font(face, size)
+        return self.fonts[key]
+
+    def render(self, text, size, color, outline=None, face=None):
+        """
+        Renvoie la surface du texte, depuis le cache si elle a déjà été rendue
+        outline: couleur du contour d'1 pixel (None = pas de contour)
+        """
+        key = (text, size, color, outline, face)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        font = self.font(size, face)
+        text_surface = font.render(text, True, color)
+        if outline is None:
+            surface = text_surface
+        else:
+            # Contour : le texte décalé en diagonale, puis le texte par-dessus
+            outline_surface = font.render(text, True, outline)
+            surface = pygame.Surface((text_surface.get_width() + 2, text_surface.get_height() + 2), pygame.SRCALPHA)
+            for dx, dy in [(0, 0), (0, 2), (2, 0), (2, 2)]:
+                surface.blit(outline_surface, (dx, dy))
+            surface.blit(text_surface, (1, 1))
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)  # Supprimer le texte le moins utilisé
+        return surface
+
+text_renderer = TextRenderer()
+
+# Atlas des lettres des touches (A, Z, E, R, Q, S) déjà rendues avec leur contour
+class KeyLabelAtlas:
+    GLOW_COLOR = (0, 191, 255)
+
+    def __init__(self, keys, size=48, glow=True):
+        self.variants = ['normal', 'glow'] if glow else ['normal']
+        self.rects = {}  # (touche, variante) -> zone de l'atlas
+
+        # Rendu de chaque lettre avec son contour noir
+        labels = {key: text_renderer.render(pygame.key.name(key).upper(), size, WHITE, outline=BLACK) for key in keys}
+        padding = 8 if glow else 0  # Place pour le halo
+        cell_width = max(label.get_width() for label in labels.values()) + padding * 2
+        cell_height = max(label.get_height() for label in labels.values()) + padding * 2
+
+        # Une colonne par touche, une ligne par variante, sur une seule texture
+        self.surface = pygame.Surface((cell_width * len(keys), cell_height * len(self.variants)), pygame.SRCALPHA)
+        for column, (key, label) in enumerate(labels.items()):
+            for row, variant in enumerate(self.variants):
+                cell = pygame.Rect(column * cell_width, row * cell_height, cell_width, cell_height)
+                label_rect = label.get_rect(center=cell.center)
+                if variant == 'glow':
+                    self.surface.blit(self.make_glow(label, padding), label_rect.inflate(padding * 2, padding * 2))
+                self.surface.blit(label, label_rect)
+                self.rects[(key, variant)] = cell
+        self.surface = self.surface.convert_alpha()
+
+    def make_glow(self, label, padding):
+        # Halo flou : silhouette colorée réduite puis agrandie
+        width, height = label.get_width() + padding * 2, label.get_height() + padding * 2
+        silhouette = pygame.Surface((width, height), pygame.SRCALPHA)
+        silhouette.blit(label, (padding, padding))
+        silhouette.fill((*self.GLOW_COLOR, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        small = pygame.transform.smoothscale(silhouette, (max(1, width // 4), max(1, height // 4)))
+        return pygame.transform.smoothscale(small, (width, height))
+
+    def get(self, key, variant='normal'):
+        # Zone de l'atlas contenant la lettre de cette touche
+        return self.rects[(key, variant)]
+
+    def draw(self, screen, key, center, variant='normal'):
+        # Un seul blit depuis l'atlas
+        area = self.rects[(key, variant)]
+        dest = area.copy()
+        dest.center = center
+        screen.blit(self.surface, dest, area)
+
+# Profileur de frames (F3)
+profiler = FrameProfiler('classic')
+
+# Particules des découpes (gravité 0.1, durée de vie 30 frames)
+slice_particles = ParticleSystem(capacity=4096, gravity=0.1, shrink=0.1)
 
 class GameObject:
     # Touches fixes pour chaque type d'objet
     FRUIT_KEYS = [pygame.K_a, pygame.K_z, pygame.K_e, pygame.K_r]  # AZER pour les fruits
     BOMB_KEY = pygame.K_q   # Q pour les bombes
     ICE_KEY = pygame.K_s    # S pour les glaçons
+
+    # Attributs fixes : objets plus petits, réutilisés par object_pool
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'object_type', 'surface', 'fruit_type', 'sliced_surface',
+                 'size', 'vx', 'vy', 'angle', 'rotation_speed', 'sliced', 'gravity', 'slice_time',
+                 'disappear_delay', 'ice_parts', 'ice_positions', 'ice_velocities',
+                 'fruit_positions', 'fruit_velocities', 'zone', 'key', 'key_char')
     
-    def __init__(self, x, y, object_type):
+    def __init__(self, x, y, object_type, rng=random):
+        self.reset(x, y, object_type, rng)
+
+    def reset(self, x, y, object_type, rng=random):
+        # rng : générateur aléatoire de la partie (trajectoire, fruit, touche)
         self.x = x
         self.y = y
+        # Position avant le dernier déplacement (pour la détection continue des coupes)
+        self.prev_x = x
+        self.prev_y = y
         self.object_type = object_type
         
         # Apparence - on définit d'abord le type de fruit et la surface
         if object_type == 'fruit':
-            self.surface, self.fruit_type = AssetLoader.get_random_fruit_image()
+            self.surface, self.fruit_type = AssetLoader.get_random_fruit_image(rng)
             self.sliced_surface = AssetLoader.SLICED_IMAGES_LEFT[self.fruit_type]
         elif object_type == 'bomb':
             self.surface = AssetLoader.BOMB_IMAGE
             self.fruit_type = None
+            self.sliced_surface = None
         else:  # ice
             self.surface = AssetLoader.ICE_IMAGE
             self.fruit_type = None
+            self.sliced_surface = None
         
         # Maintenant on peut définir la taille en fonction du type
         if object_type == 'fruit':
@@ -286,21 +602,21 @@ class GameObject:
             self.size = 120  # Pour les bombes et les glaçons
         
         # Trajectoire parabolique ajustée
-        angle = random.uniform(math.pi/3, 2*math.pi/3)  # Garde l'angle entre 60° et 120°
-        speed = random.uniform(18, 22)  # Vitesse réduite
+        angle = rng.uniform(math.pi/3, 2*math.pi/3)  # Garde l'angle entre 60° et 120°
+        speed = rng.uniform(18, 22)  # Vitesse réduite
         self.vx = math.cos(angle) * speed
         self.vy = -math.sin(angle) * speed
         
         # Rotation
         self.angle = 0
-        self.rotation_speed = random.uniform(-8, 8)
+        self.rotation_speed = rng.uniform(-8, 8)
             
         self.sliced = False
-        self.particles = []
         self.gravity = 0.45  # Gravité légèrement augmentée
         self.slice_time = 0
         self.disappear_delay = 1000  # Temps en ms avant de disparaître
         self.ice_parts = []
+        self.ice_positions = []
         self.ice_velocities = []
         self.fruit_positions = []  # Pour stocker la position des fruits coupés
         self.fruit_velocities = []  # Pour stocker les vélocités des fruits coupés
@@ -308,7 +624,7 @@ class GameObject:
         
         # Attribuer une touche selon le type d'objet
         if object_type == 'fruit':
-            self.key = random.choice(GameObject.FRUIT_KEYS)
+            self.key = rng.choice(GameObject.FRUIT_KEYS)
         elif object_type == 'bomb':
             self.key = GameObject.BOMB_KEY
         else:  # ice
@@ -331,6 +647,8 @@ class GameObject:
     def update(self):
         if not self.sliced:
             # Mise à jour normale pour tous les objets non coupés
+            self.prev_x = self.x
+            self.prev_y = self.y
             self.x += self.vx
             self.y += self.vy
             self.vy += self.gravity
@@ -356,8 +674,9 @@ class GameObject:
                 self.fruit_positions[i][0] += self.fruit_velocities[i][0]
                 self.fruit_positions[i][1] += self.fruit_velocities[i][1]
 
-    def draw(self, screen):
-        current_time = pygame.time.get_ticks()
+    def draw(self, screen, alpha=1.0):
+        # alpha : position d'affichage entre l'état précédent (0) et l'état courant (1)
+        current_time = get_ticks()
         
         # Si l'objet est coupé depuis trop longtemps, ne pas le dessiner
         if self.sliced and current_time - self.slice_time > self.disappear_delay:
@@ -366,8 +685,8 @@ class GameObject:
         if self.sliced:
             if self.object_type == 'fruit':
                 # Dessiner les deux moitiés du fruit
-                left_surface = pygame.transform.rotate(AssetLoader.SLICED_IMAGES_LEFT[self.fruit_type], self.angle)
-                right_surface = pygame.transform.rotate(AssetLoader.SLICED_IMAGES_RIGHT[self.fruit_type], self.angle)
+                left_surface = rotation_cache.rotate(AssetLoader.SLICED_IMAGES_LEFT[self.fruit_type], self.angle)
+                right_surface = rotation_cache.rotate(AssetLoader.SLICED_IMAGES_RIGHT[self.fruit_type], self.angle)
                 
                 # Position de chaque moitié
                 left_rect = left_surface.get_rect(center=(self.fruit_positions[0][0], self.fruit_positions[0][1]))
@@ -380,40 +699,27 @@ class GameObject:
             elif self.object_type == 'ice':
                 # Dessiner les deux parties du glaçon
                 for i, (part, pos) in enumerate(zip(self.ice_parts, self.ice_positions)):
-                    rotated_surface = pygame.transform.rotate(part, self.angle)
+                    rotated_surface = rotation_cache.rotate(part, self.angle)
                     rect = rotated_surface.get_rect(center=(pos[0], pos[1]))
                     screen.blit(rotated_surface, rect)
                 return
         
-        # Si l'objet n'est pas coupé, dessiner normalement
-        rotated_surface = pygame.transform.rotate(self.surface, self.angle)
-        rect = rotated_surface.get_rect(center=(self.x, self.y))
+        # Si l'objet n'est pas coupé, dessiner normalement (position interpolée)
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        rotated_surface = rotation_cache.rotate(self.surface, self.angle)
+        rect = rotated_surface.get_rect(center=(x, y))
         screen.blit(rotated_surface, rect)
         
         # Afficher la lettre au-dessus de l'objet avec un meilleur style
         if not self.sliced:
-            # Plus grande taille de police
-            font = pygame.font.Font(None, 48)  # Augmenté de 36 à 48
-            
-            # Créer le contour noir
-            shadow_text = font.render(self.key_char, True, BLACK)
-            shadow_rect = shadow_text.get_rect(center=(self.x, self.y - self.size/2 - 25))
-            
-            # Créer le texte blanc
-            key_text = font.render(self.key_char, True, WHITE)
-            text_rect = key_text.get_rect(center=(self.x, self.y - self.size/2 - 25))
-            
-            # Dessiner le contour en décalant légèrement le texte noir
-            for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1)]:
-                screen.blit(shadow_text, (shadow_rect.x + dx, shadow_rect.y + dy))
-            
-            # Dessiner le texte blanc par-dessus
-            screen.blit(key_text, text_rect)
+            # Texte blanc avec contour noir, taille 48, depuis l'atlas des touches
+            AssetLoader.KEY_LABELS.draw(screen, self.key, (x, y - self.size/2 - 25))
 
     def slice(self):
         if not self.sliced:
             self.sliced = True
-            self.slice_time = pygame.time.get_ticks()
+            self.slice_time = get_ticks()
             
             if self.object_type == 'ice':
                 # Créer les deux parties du glaçon
@@ -442,14 +748,88 @@ class GameObject:
             
             # Création de particules lors de la découpe
             particle_color = (200, 200, 255) if self.object_type == 'ice' else (random.randint(100, 255), random.randint(100, 255), 0)
-            for _ in range(20):
-                self.particles.append(Particle(self.x, self.y, particle_color))
+            slice_particles.emit(self.x, self.y, 20, particle_color)
+
+    def cut_radius(self):
+        # Zone de coupe plus précise selon le type d'objet
+        return self.size/3 if self.object_type == 'bomb' else self.size/2
 
     def is_clicked(self, pos):
         distance = math.sqrt((pos[0] - self.x) ** 2 + (pos[1] - self.y) ** 2)
         return distance < self.size/2
 
+# Objets sortis du jeu, réutilisés par les apparitions suivantes
+object_pool = ObjectPool(GameObject, 'objets Classic')
+
+# Grille uniforme des objets non coupés, pour ne tester que les objets proches de la lame
+class SpatialGrid:
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (colonne, ligne) -> liste de (ordre, objet)
+
+    def rebuild(self, objects):
+        self.cells = {}
+        for order, obj in enumerate(objects):
+            if not obj.sliced:
+                # Boîte englobant le cercle de coupe sur tout son déplacement de la frame
+                radius = obj.cut_radius()
+                self.insert(order, obj,
+                            min(obj.x, obj.prev_x) - radius, min(obj.y, obj.prev_y) - radius,
+                            max(obj.x, obj.prev_x) + radius, max(obj.y, obj.prev_y) + radius)
+
+    def insert(self, order, obj, left, top, right, bottom):
+        # L'objet est ajouté à toutes les cellules que touche la boîte
+        cs = self.cell_size
+        for cx in range(math.floor(left / cs), math.floor(right / cs) + 1):
+            for cy in range(math.floor(top / cs), math.floor(bottom / cs) + 1):
+                self.cells.setdefault((cx, cy), []).append((order, obj))
+
+    def cells_on_segment(self, start, end):
+        # Cellules traversées par le segment, dans l'ordre (parcours de grille d'Amanatides et Woo)
+        cs = self.cell_size
+        x0, y0 = start[0] / cs, start[1] / cs
+        x1, y1 = end[0] / cs, end[1] / cs
+        cx, cy = math.floor(x0), math.floor(y0)
+        end_cx, end_cy = math.floor(x1), math.floor(y1)
+        dx, dy = x1 - x0, y1 - y0
+
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Fraction du segment parcourue avant la prochaine frontière verticale / horizontale
+        t_max_x = ((cx + (step_x > 0)) - x0) / dx if dx else math.inf
+        t_max_y = ((cy + (step_y > 0)) - y0) / dy if dy else math.inf
+        t_delta_x = abs(1 / dx) if dx else math.inf
+        t_delta_y = abs(1 / dy) if dy else math.inf
+
+        cells = [(cx, cy)]
+        for _ in range(abs(end_cx - cx) + abs(end_cy - cy)):
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+            cells.append((cx, cy))
+        return cells
+
+    def query_path(self, points):
+        # Objets des cellules traversées par la ligne brisée, sans doublon, dans l'ordre d'insertion
+        found = {}
+        for start, end in zip(points, points[1:]):
+            for cell in self.cells_on_segment(start, end):
+                for order, obj in self.cells.get(cell, ()):
+                    found[order] = obj
+        return [found[order] for order in sorted(found)]
+
+def premultiply(color, alpha):
+    # Couleur RGB multipliée par son opacité (pour BLEND_PREMULTIPLIED)
+    return (color[0] * alpha // 255, color[1] * alpha // 255, color[2] * alpha // 255, alpha)
+
 class Trail:
+    BANDS = 4        # Nombre de tronçons d'opacité différente (nombre d'appels de dessin borné)
+    GLOW_WIDTH = 20  # Épaisseur de la lueur externe
+    TILE_SIZE = 64   # Taille des cases du calque effacées et affichées à chaque frame
+
     def __init__(self):
         self.points = []
         self.max_length = 20  # Plus long pour un meilleur effet
@@ -463,6 +843,8 @@ class Trail:
             b = 255
             a = min(255, int(255 * (i+10)/20))  # Plus opaque
             self.colors.append((r, g, b, a))
+        # Calque transparent réutilisé d'une frame à l'autre (créé au premier dessin)
+        self.layer = None
 
     def add_point(self, pos):
         self.points.append(pos)
@@ -470,30 +852,66 @@ class Trail:
             self.points.pop(0)
 
     def draw(self, screen):
-        if len(self.points) > 1:
-            # Effet de lueur (glow effect)
-            for i in range(len(self.points)-1):
-                start = self.points[i]
-                end = self.points[i+1]
-                
-                # Dessiner plusieurs lignes de différentes épaisseurs pour l'effet de lueur
-                pygame.draw.line(screen, (0, 100, 255, 50), start, end, 20)  # Lueur externe
-                pygame.draw.line(screen, (100, 200, 255, 100), start, end, 15)  # Lueur moyenne
-                pygame.draw.line(screen, self.colors[i], start, end, 10)  # Ligne principale
-                
-                # Ligne centrale blanche pour l'effet néon
-                pygame.draw.line(screen, (255, 255, 255, 255), start, end, 4)
+        if len(self.points) < 2:
+            return
+        if self.layer is None or self.layer.get_size() != screen.get_size():
+            self.layer = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+
+        # Cases du calque couvertes par la traînée (boîte de chaque segment élargie de la lueur)
+        tile = Trail.TILE_SIZE
+        margin = Trail.GLOW_WIDTH
+        bounds = self.layer.get_rect()
+        tiles = set()
+        for (x1, y1), (x2, y2) in zip(self.points, self.points[1:]):
+            for tx in range(int(min(x1, x2) - margin) // tile, int(max(x1, x2) + margin) // tile + 1):
+                for ty in range(int(min(y1, y2) - margin) // tile, int(max(y1, y2) + margin) // tile + 1):
+                    tiles.add((tx, ty))
+        areas = [pygame.Rect(tx * tile, ty * tile, tile, tile).clip(bounds) for tx, ty in sorted(tiles)]
+        areas = [area for area in areas if area.width and area.height]
+        for area in areas:
+            self.layer.fill((0, 0, 0, 0), area)
+
+        # La traînée est découpée en tronçons, du plus ancien (transparent) au plus récent (opaque)
+        segments = len(self.points) - 1
+        count = min(Trail.BANDS, segments)
+        bands = []
+        for band in range(count):
+            first = band * segments // count
+            last = (band + 1) * segments // count
+            bands.append((self.points[first:last + 1], self.colors[last - 1]))
+
+        # Sur un calque SRCALPHA les couleurs sont écrites telles quelles : chaque épaisseur est
+        # dessinée sur tous les tronçons avant la suivante, plus fine, qui la remplace au centre
+        for points, (r, g, b, a) in bands:
+            pygame.draw.lines(self.layer, premultiply((0, 100, 255), 50 * a // 255), False, points, margin)  # Lueur externe
+        for points, (r, g, b, a) in bands:
+            pygame.draw.lines(self.layer, premultiply((100, 200, 255), 100 * a // 255), False, points, 15)  # Lueur moyenne
+        for points, (r, g, b, a) in bands:
+            pygame.draw.lines(self.layer, premultiply((r, g, b), a), False, points, 10)  # Ligne principale
+        # Ligne centrale blanche pour l'effet néon
+        for points, (r, g, b, a) in bands:
+            pygame.draw.lines(self.layer, premultiply((255, 255, 255), a), False, points, 4)
+
+        # Les couleurs du calque sont prémultipliées par l'alpha : mélange plus rapide
+        screen.blits([(self.layer, area, area, pygame.BLEND_PREMULTIPLIED) for area in areas], doreturn=False)
 
 class AnimatedHeart:
+    FRAMES = None  # Frames du GIF, décodées une seule fois pour tous les cœurs
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.frame = 0
         self.animation_speed = 0.2
         self.animation_time = 0
-        self.frames = []
-        
+        if AnimatedHeart.FRAMES is None:
+            AnimatedHeart.FRAMES = AnimatedHeart.load_frames()
+        self.frames = AnimatedHeart.FRAMES
+
+    @staticmethod
+    def load_frames():
         # Charger toutes les frames du GIF
+        frames = []
         try:
             gif = Image.open('assets_fruits/animated-heart-image-0503.gif')
             for frame_index in range(gif.n_frames):
@@ -504,13 +922,14 @@ class AnimatedHeart:
                 )
                 # Encore plus grands cœurs (100,100 -> 120,120)
                 frame_surface = pygame.transform.scale(frame_surface, (120, 120))
-                self.frames.append(frame_surface)
+                frames.append(frame_surface)
         except Exception as e:
             print(f"Erreur de chargement du cœur animé: {e}")
             # Cœur par défaut aussi plus grand
             surface = pygame.Surface((120, 120), pygame.SRCALPHA)
             pygame.draw.circle(surface, (255, 0, 0), (60, 60), 60)
-            self.frames = [surface]
+            frames = [surface]
+        return frames
 
     def update(self):
         self.animation_time += self.animation_speed
@@ -527,7 +946,6 @@ class ComboAnimation:
         self.combo_size = combo_size  # Nombre de fruits dans le combo
         self.lifetime = 60  # Durée de l'animation en frames
         self.current_frame = 0
-        self.font = pygame.font.Font(None, 74)
         self.colors = [
             (255, 255, 0),    # Jaune
             (255, 165, 0),    # Orange
@@ -561,8 +979,7 @@ class ComboAnimation:
         # Rendre le texte avec la taille actuelle
         base_size = 74
         current_size = int(base_size * scale)
-        font = pygame.font.Font(None, current_size)
-        text_surface = font.render(text, True, color)
+        text_surface = text_renderer.render(text, current_size, color)
         
         # Position avec un petit mouvement vers le haut
         y_offset = -50 * progress  # Monte progressivement
@@ -572,16 +989,18 @@ class ComboAnimation:
         screen.blit(text_surface, pos)
 
 class Scoreboard:
-    def __init__(self):
+    def __init__(self, filename='highscores.json'):
         self.scores = {
             'facile': [],
             'moyen': [],
             'difficile': []
         }
-        self.filename = 'highscores.json'
+        self.filename = filename  # None : scores gardés en mémoire seulement (simulation)
         self.load_scores()
     
     def load_scores(self):
+        if self.filename is None:
+            return
         try:
             if os.path.exists(self.filename):
                 with open(self.filename, 'r') as f:
@@ -595,6 +1014,8 @@ class Scoreboard:
             self.save_scores()  # Créer un nouveau fichier en cas d'erreur
     
     def save_scores(self):
+        if self.filename is None:
+            return
         try:
             with open(self.filename, 'w') as f:
                 json.dump(self.scores, f, indent=4)  # indent=4 pour un format plus lisible
@@ -728,9 +1149,12 @@ class Game:
         }
     }
 
-    def __init__(self, difficulty='moyen', player_name=''):
+    def __init__(self, difficulty='moyen', player_name='', scoreboard=None, seed=None):
         self.difficulty = difficulty
         self.player_name = player_name
+        # Tout le hasard de la partie vient de ce générateur : même graine, même partie
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
         self.translation = Translation()  # Initialiser la traduction
         self.settings = Game.DIFFICULTY_SETTINGS[difficulty]
         
@@ -742,8 +1166,13 @@ class Game:
         self.combo_count = 0
         self.frozen_time = 0
         self.objects = []
+        # Objets non coupés par touche, dans l'ordre d'apparition (dict utilisé comme ensemble ordonné)
+        self.key_buckets = {key: {} for key in GameObject.FRUIT_KEYS + [GameObject.BOMB_KEY, GameObject.ICE_KEY]}
+        self.grid = SpatialGrid()
+        self.blade_points = []    # Positions de la lame reçues depuis la dernière frame
+        self.blade_anchor = None  # Dernière position de la lame à la frame précédente
         self.trail = Trail()
-        self.font = pygame.font.Font(None, 36)
+        self.font = text_renderer.font(36)
         self.last_spawn = 0
         self.spawn_interval = self.settings['spawn_interval']
         self.high_score = 0
@@ -755,15 +1184,15 @@ class Game:
         self.last_slice_time = 0
         self.current_combo_fruits = []
         self.game_over_sound_played = False  # Ajouter cette variable
-        self.scoreboard = Scoreboard()
+        self.scoreboard = scoreboard if scoreboard is not None else Scoreboard()
         
         # Créer un fond noir par défaut
         self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         self.background.fill((0, 0, 0))
         
         try:
-            self.background = pygame.image.load('assets_fruits/background.jpg').convert()
-            self.background = pygame.transform.scale(self.background, (WINDOW_WIDTH, WINDOW_HEIGHT))
+            # Fond déjà chargé et redimensionné par AssetLoader
+            self.background = AssetLoader.BACKGROUND
         except Exception as e:
             print(f"Erreur de chargement du fond: {e}")
 
@@ -779,16 +1208,47 @@ class Game:
         }
 
     def spawn_object(self):
-        for _ in range(random.randint(1, self.settings['spawn_count'])):
-            x = random.randint(100, WINDOW_WIDTH - 100)
+        for _ in range(self.rng.randint(1, self.settings['spawn_count'])):
+            x = self.rng.randint(100, WINDOW_WIDTH - 100)
             weights = self.settings['weights']
-            object_type = random.choices(['fruit', 'bomb', 'ice'], weights=weights)[0]
-            self.objects.append(GameObject(x, WINDOW_HEIGHT, object_type))
+            object_type = self.rng.choices(['fruit', 'bomb', 'ice'], weights=weights)[0]
+            self.add_object(object_pool.acquire(x, WINDOW_HEIGHT, object_type, self.rng))
+
+    def add_object(self, obj):
+        self.objects.append(obj)
+        if not obj.sliced:
+            self.key_buckets[obj.key][obj] = None
+
+    def remove_object(self, obj):
+        self.objects.remove(obj)
+        self.key_buckets[obj.key].pop(obj, None)
+        object_pool.release(obj)
+
+    def release_objects(self):
+        # Fin de la partie : tous les objets restants retournent dans la réserve
+        for obj in self.objects:
+            object_pool.release(obj)
+        self.objects = []
+        self.key_buckets = {key: {} for key in self.key_buckets}
+        self.grid.rebuild(self.objects)
+
+    def slice_object(self, obj):
+        # Coupe l'objet et le retire de l'index des touches
+        obj.slice()
+        self.key_buckets[obj.key].pop(obj, None)
+
+    def objects_for_key(self, key):
+        # Objets non coupés associés à cette touche, sans parcourir tous les objets
+        return list(self.key_buckets.get(key, ()))
 
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
         if self.frozen_time > current_time:
+            # Les objets gelés ne bougent pas pendant cette frame
+            for obj in self.objects:
+                obj.prev_x, obj.prev_y = obj.x, obj.y
+            self.grid.rebuild(self.objects)
             return
         
         if current_time - self.last_spawn > self.spawn_interval and not self.game_over:
@@ -806,7 +1266,16 @@ class Game:
                     self.strikes += 1
                     if self.strikes >= 3:
                         self.end_game()  # Utiliser la nouvelle méthode
-                self.objects.remove(obj)
+                self.remove_object(obj)
+            elif obj.sliced and current_time - obj.slice_time > obj.disappear_delay:
+                # Objet coupé qui ne s'affiche plus : retour dans la réserve
+                self.remove_object(obj)
+
+        # Reconstruire la grille avec les nouvelles positions
+        self.grid.rebuild(self.objects)
+
+        # Mettre à jour les particules des découpes
+        slice_particles.update()
 
         # Mettre à jour l'animation des cœurs
         for heart in self.hearts:
@@ -815,19 +1284,25 @@ class Game:
         # Mettre à jour les animations de combo
         self.combo_animations = [anim for anim in self.combo_animations if anim.update()]
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         # Affichage du fond
         screen.blit(self.background, (0, 0))
+        profiler.mark('background')
         
         # Dessin de la trainée du curseur
         self.trail.draw(screen)
+        profiler.mark('trail')
         
-        # Dessin des objets
+        # Dessin des objets, interpolés entre les deux derniers pas de simulation
         for obj in self.objects:
-            obj.draw(screen)
+            obj.draw(screen, alpha)
+
+        # Dessin des particules
+        slice_particles.draw(screen)
+        profiler.mark('objects')
 
         # Interface utilisateur
-        score_text = self.font.render(f"{self.translation.get_text('score')}: {self.score}", True, WHITE)
+        score_text = text_renderer.render(f"{self.translation.get_text('score')}: {self.score}", 36, WHITE)
         screen.blit(score_text, (10, 10))
         
         # Affichage des vies avec les cœurs animés
@@ -837,10 +1312,7 @@ class Game:
 
         if self.game_over:
             # Utiliser la traduction pour le message de game over
-            game_over_text = self.font.render(
-                self.translation.get_text('game_over'), 
-                True, RED
-            )
+            game_over_text = text_renderer.render(self.translation.get_text('game_over'), 36, RED)
             screen.blit(game_over_text, (WINDOW_WIDTH//2 - game_over_text.get_width()//2, WINDOW_HEIGHT//2))
             
         # Affichage du couteau à la position de la souris
@@ -849,17 +1321,16 @@ class Game:
         screen.blit(AssetLoader.KNIFE_IMAGE, knife_rect)
 
         # Affichage du meilleur score
-        high_score_text = self.font.render(
-            f"{self.translation.get_text('best_score')}: {self.high_score}", 
-            True, WHITE
+        high_score_text = text_renderer.render(
+            f"{self.translation.get_text('best_score')}: {self.high_score}", 36, WHITE
         )
         screen.blit(high_score_text, (WINDOW_WIDTH - 250, 10))
         
         # Affichage du multiplicateur de combo
         if self.combo_count > 1:
-            combo_text = self.font.render(
-                self.translation.get_text('combo').format(self.combo_multiplier), 
-                True, (255, 255, 0))
+            combo_text = text_renderer.render(
+                self.translation.get_text('combo').format(self.combo_multiplier), 36, (255, 255, 0)
+            )
             screen.blit(combo_text, (WINDOW_WIDTH//2 - 50, 10))
 
         # Afficher l'icône du haut-parleur
@@ -869,66 +1340,139 @@ class Game:
         # Dessiner les animations de combo
         for anim in self.combo_animations:
             anim.draw(screen)
+        profiler.mark('hud')
+
+    def apply_input(self, action, value=None):
+        """
+        Entrée du joueur : 'down' / 'move' (position de la souris), 'up', 'key' (touche pygame)
+        Utilisé par la boucle principale, la simulation sans fenêtre et les replays
+        """
+        if action == 'down':
+            self.mouse_pressed = True
+            self.slice_at_position(value)
+        elif action == 'move':
+            if self.mouse_pressed:
+                self.slice_at_position(value)
+        elif action == 'up':
+            self.mouse_pressed = False
+        elif action == 'key':
+            self.handle_key(value)
+
+    def step(self, mouse_pos):
+        # Un pas de simulation : coupes en attente, traînée, physique
+        self.flush_slices()
+        profiler.mark('collision')
+        self.trail.add_point(mouse_pos)
+        self.update()
+        profiler.mark('update')
 
     def slice_at_position(self, pos):
+        # Mémorise la position de la lame ; le trajet est testé par flush_slices() une fois par frame
+        if self.game_over:
+            return
+
+        if not self.blade_points or self.blade_points[-1] != pos:
+            self.blade_points.append(pos)
+
+    def flush_slices(self):
+        # Trajet de la lame depuis la frame précédente (repris à la dernière position connue)
+        path = ([self.blade_anchor] if self.blade_anchor else []) + self.blade_points
+        self.blade_points = []
+        # Le trajet continue à la frame suivante tant que le bouton reste enfoncé
+        self.blade_anchor = path[-1] if path and self.mouse_pressed else None
+        if len(path) > 1:
+            self.slice_objects(self.sweep_blade(path))
+
+    def sweep_blade(self, path):
+        """
+        Détection continue des coupes pour une frame
+        path: positions successives de la lame pendant la frame
+        Chaque segment occupe une part égale de la frame ; pendant ce temps la pointe de la lame
+        et chaque objet (de prev_x, prev_y à x, y) se déplacent en ligne droite. Un objet est coupé
+        si la pointe passe à moins de cut_radius() de son centre.
+        Renvoie les objets coupés dans l'ordre du passage de la lame (puis l'ordre de self.objects)
+        """
+        points = np.asarray(path, dtype=np.float64)
+        blade_start, blade_end = points[:-1], points[1:]
+
+        # Ne couper que si la souris bouge suffisamment vite
+        if np.hypot(*(blade_end - blade_start).T).sum() <= MIN_BLADE_DISTANCE:
+            return []
+
+        # Seuls les objets des cellules traversées par la lame sont testés
+        candidates = self.grid.query_path(path)
+        if not candidates:
+            return []
+
+        prev = np.array([(obj.prev_x, obj.prev_y) for obj in candidates], dtype=np.float64)
+        motion = np.array([(obj.x, obj.y) for obj in candidates], dtype=np.float64) - prev
+        radius = np.array([obj.cut_radius() for obj in candidates], dtype=np.float64)
+
+        # Tableaux (segments, objets, 2) : position des objets au début et à la fin de chaque segment
+        steps = len(blade_start)
+        t0 = (np.arange(steps, dtype=np.float64) / steps)[:, None, None]
+        t1 = (np.arange(1, steps + 1, dtype=np.float64) / steps)[:, None, None]
+        obj_start = prev + motion * t0
+        obj_end = prev + motion * t1
+
+        # Mouvement de l'objet relatif à la pointe de la lame : d(u) = d0 + dv * u, u dans [0, 1]
+        d0 = obj_start - blade_start[:, None]
+        dv = (obj_end - obj_start) - (blade_end - blade_start)[:, None]
+        dv_squared = dv[..., 0] * dv[..., 0] + dv[..., 1] * dv[..., 1]
+        dot = d0[..., 0] * dv[..., 0] + d0[..., 1] * dv[..., 1]
+        u = np.zeros_like(dot)
+        np.divide(-dot, dv_squared, out=u, where=dv_squared > 0)
+        np.clip(u, 0, 1, out=u)
+
+        # Distance minimale pendant le segment
+        closest_x = d0[..., 0] + dv[..., 0] * u
+        closest_y = d0[..., 1] + dv[..., 1] * u
+        hit = closest_x * closest_x + closest_y * closest_y < radius * radius
+
+        # Instant du premier contact de chaque objet (numéro du segment + fraction)
+        hit_time = np.where(hit, np.arange(steps)[:, None] + u, np.inf).min(axis=0)
+        touched = np.flatnonzero(np.isfinite(hit_time))
+        # Tri stable : à instant égal, l'ordre de self.objects est conservé
+        touched = touched[np.argsort(hit_time[touched], kind='stable')]
+        return [candidates[i] for i in touched.tolist()]
+
+    def slice_objects(self, objects):
+        # Coupe les objets dans l'ordre donné ; une bombe arrête la coupe
         if self.game_over:
             return
 
         sliced_objects = []
-        current_time = pygame.time.get_ticks()
-        
-        # Créer une ligne entre le point précédent et le point actuel de la souris
-        if len(self.trail.points) > 1:
-            prev_pos = self.trail.points[-2]
-            current_pos = self.trail.points[-1]
-            
-            # Calculer le vecteur de direction
-            dx = current_pos[0] - prev_pos[0]
-            dy = current_pos[1] - prev_pos[1]
-            movement_length = math.sqrt(dx*dx + dy*dy)
-            
-            # Ne couper que si la souris bouge suffisamment vite
-            if movement_length > 5:
-                for obj in self.objects:
-                    if not obj.sliced:
-                        x0, y0 = obj.x, obj.y
-                        x1, y1 = prev_pos
-                        x2, y2 = current_pos
-                        
-                        # Calculer la distance point-ligne
-                        numerator = abs((y2-y1)*x0 - (x2-x1)*y0 + x2*y1 - y2*x1)
-                        denominator = math.sqrt((y2-y1)**2 + (x2-x1)**2)
-                        
-                        if denominator != 0:
-                            distance = numerator/denominator
-                            
-                            # Vérifier si le point est entre les deux points de la ligne
-                            dot_product = ((x0-x1)*(x2-x1) + (y0-y1)*(y2-y1)) / (denominator * denominator)
-                            
-                            # Zone de coupe plus précise selon le type d'objet
-                            cut_threshold = obj.size/3 if obj.object_type == 'bomb' else obj.size/2
-                            
-                            # Ne couper que si l'objet est vraiment sur la trajectoire
-                            if distance < cut_threshold and 0 <= dot_product <= 1:
-                                obj.slice()
-                                sliced_objects.append(obj)
-                                try:
-                                    AssetLoader.SOUNDS['slice'].play()  # Son de coupe
-                                    if obj.object_type == 'bomb':
-                                        self.game_over = True
-                                        AssetLoader.SOUNDS['game_over'].play()
-                                    elif obj.object_type == 'ice':
-                                        AssetLoader.SOUNDS['slice'].play()
-                                        self.frozen_time = current_time + random.randint(3000, 5000)  # Effet de gel
-                                    elif obj.object_type == 'fruit':
-                                        AssetLoader.SOUNDS['slice'].play()
-                                except Exception as e:
-                                    print(f"Erreur lors de la lecture du son: {e}")
-        
+        current_time = get_ticks()
+
+        for obj in objects:
+            if self.game_over:
+                break
+            if obj.sliced:
+                continue
+            self.slice_object(obj)
+            sliced_objects.append(obj)
+            try:
+                AssetLoader.SOUNDS['slice'].play()  # Son de coupe
+                if obj.object_type == 'bomb':
+                    self.game_over = True
+                    AssetLoader.SOUNDS['game_over'].play()
+                elif obj.object_type == 'ice':
+                    AssetLoader.SOUNDS['slice'].play()
+                    self.frozen_time = current_time + self.rng.randint(3000, 5000)  # Effet de gel
+                elif obj.object_type == 'fruit':
+                    AssetLoader.SOUNDS['slice'].play()
+            except Exception as e:
+                print(f"Erreur lors de la lecture du son: {e}")
+
+        self.score_slices(sliced_objects)
+
+    def score_slices(self, sliced_objects):
+        current_time = get_ticks()
+
         # Gestion des combos avec une seule fenêtre de temps
         fruits_sliced = [obj for obj in sliced_objects if obj.object_type == 'fruit']
         if fruits_sliced:
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
             time_since_last = current_time - self.last_slice_time
             
             # Si on est dans la fenêtre de temps
@@ -972,12 +1516,12 @@ class Game:
             return
             
         sliced_objects = []
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
-        # Vérifier tous les objets qui correspondent à cette touche
-        for obj in self.objects:
-            if not obj.sliced and obj.key == key:
-                obj.slice()
+        # Seuls les objets qui correspondent à cette touche sont parcourus
+        for obj in self.objects_for_key(key):
+            if not obj.sliced:
+                self.slice_object(obj)
                 sliced_objects.append(obj)
                 try:
                     AssetLoader.SOUNDS['slice'].play()  # Jouer le son de coupe
@@ -986,7 +1530,7 @@ class Game:
                         AssetLoader.SOUNDS['game_over'].play()
                     elif obj.object_type == 'ice':
                         AssetLoader.SOUNDS['slice'].play()
-                        self.frozen_time = current_time + random.randint(3000, 5000)  # Effet de gel
+                        self.frozen_time = current_time + self.rng.randint(3000, 5000)  # Effet de gel
                     elif obj.object_type == 'fruit':
                         AssetLoader.SOUNDS['slice'].play()
                 except Exception as e:
@@ -1061,6 +1605,9 @@ class Menu:
         self.current_positions = []
         self.hover_offset = 0
         self.time = 0
+        # Seules les zones modifiées sont envoyées à l'écran
+        self.dirty = DirtyRects()
+        self.drawn_state = None
         
         # Charger le background
         try:
@@ -1086,14 +1633,22 @@ class Menu:
         # Animation de flottement
         self.hover_offset = math.sin(self.time) * 10
         
-        # Animation d'échelle au survol
+        # Animation d'échelle au survol (arrêtée une fois la cible atteinte)
         self.hover_scale += (self.target_scale - self.hover_scale) * self.animation_speed
+        if abs(self.target_scale - self.hover_scale) < 0.001:
+            self.hover_scale = self.target_scale
         
         # Mise à jour des positions
         for i in range(len(self.current_positions)):
             target = self.option_positions[i]
             current = self.current_positions[i]
-            self.current_positions[i] = current + (target - current) * 0.2
+            self.current_positions[i] = target if abs(target - current) < 0.1 else current + (target - current) * 0.2
+
+    def animating(self):
+        # Faux quand l'écran ne peut plus changer sans un événement : la boucle peut alors dormir
+        if self.state == 'difficulty':
+            return True  # L'option sélectionnée flotte et pulse en continu
+        return self.hover_scale != self.target_scale or self.current_positions != self.option_positions
     
     def render_text(self, text, color):
         # Méthode simplifiée pour le rendu du texte
@@ -1122,6 +1677,7 @@ class Menu:
             text_rect = text.get_rect(center=(WINDOW_WIDTH//2, self.current_positions[i]))
             
             screen.blit(text, text_rect)
+            self.dirty.track(('option', i), text_rect, (option, color))
             self.option_rects.append(text_rect)
     
     def handle_input(self, event):
@@ -1183,12 +1739,18 @@ class Menu:
         return None
 
     def draw(self, screen):
+        # Nouvel écran du menu : tout est réaffiché
+        if self.state != self.drawn_state:
+            self.dirty.invalidate()
+            self.drawn_state = self.state
+
         screen.blit(self.background, (0, 0))
         self.option_rects = []
         
         # Dessiner le haut-parleur
         speaker_img = AssetLoader.SPEAKER_ON if self.music_on else AssetLoader.SPEAKER_OFF
         screen.blit(speaker_img, self.speaker_rect)
+        self.dirty.track('speaker', self.speaker_rect, self.music_on)
         
         if self.state == 'main':
             self.draw_main_menu(screen)
@@ -1242,6 +1804,9 @@ class Menu:
             if i == self.selected:
                 glow_rect = glow_surf.get_rect(center=(WINDOW_WIDTH//2, y))
                 screen.blit(glow_surf, glow_rect)
+                self.dirty.track(('difficulty', i), text_rect.union(glow_rect), (option, color))
+            else:
+                self.dirty.track(('difficulty', i), text_rect, (option, color))
             screen.blit(text, text_rect)
             
             self.option_rects.append(text_rect)
@@ -1285,7 +1850,8 @@ class Menu:
         
         # Zone de saisie
         name_text = self.font.render(self.player_name + "_", True, WHITE)
-        screen.blit(name_text, (WINDOW_WIDTH//2 - name_text.get_width()//2, 300))
+        name_rect = screen.blit(name_text, (WINDOW_WIDTH//2 - name_text.get_width()//2, 300))
+        self.dirty.track('name', name_rect, self.player_name)
         
         # Instructions
         info = pygame.font.Font(None, 36).render(
@@ -1294,12 +1860,37 @@ class Menu:
         screen.blit(info, (WINDOW_WIDTH//2 - info.get_width()//2, 400))
 
 def main():
+    # --record DOSSIER : chaque partie est enregistrée dans DOSSIER/replay-<graine>.rpl
+    record_dir = sys.argv[sys.argv.index('--record') + 1] if '--record' in sys.argv[:-1] else None
+
     clock = pygame.time.Clock()
-    AssetLoader.load_assets()
+    timestep = FixedTimestep()
+    # Assets chargés une seule fois, même si le mode est relancé depuis le lanceur
+    if not AssetLoader.loaded:
+        AssetLoader.load_assets(screen)
+    AssetLoader.play_music()
     
     menu = Menu()
     game = None
     in_menu = True
+    # Le temps de la partie avance d'un pas de simulation à la fois : la partie ne dépend
+    # que de sa graine et des entrées, et peut être rejouée à l'identique
+    game_clock = None
+    recording = None
+
+    def play_input(action, value=None):
+        if recording:
+            recording.record_action(game_clock.steps, action, value)
+        game.apply_input(action, value)
+
+    def save_recording():
+        if recording:
+            recording.steps = game_clock.steps
+            recording.score = game.score
+            os.makedirs(record_dir, exist_ok=True)
+            path = os.path.join(record_dir, f"replay-{recording.seed}.rpl")
+            recording.save(path)
+            print(f"Partie enregistrée dans {path}")
     
     # Dictionnaire de conversion des difficultés
     difficulty_convert = {
@@ -1313,11 +1904,22 @@ def main():
     }
     
     running = True
+    profiler.begin_frame()
     while running:
-        for event in pygame.event.get():
+        # Menu immobile : le processus dort jusqu'au prochain événement au lieu de redessiner
+        if in_menu and not menu.animating() and not profiler.visible:
+            events = wait_events()
+        else:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif profiler.handle_event(event):
+                if in_menu:
+                    menu.dirty.invalidate()  # Overlay du profileur affiché ou retiré
+                continue
             elif in_menu:
+                menu.dirty.handle_event(event)
                 result = menu.handle_input(event)
                 if result == 'quit':
                     running = False
@@ -1330,42 +1932,79 @@ def main():
                     # Transférer la langue actuelle du menu au jeu
                     game.translation.current_language = menu.translation.current_language
                     in_menu = False
+                    pause_gc()
+                    timestep.reset()
+                    game_clock = SimulationClock()
+                    use_clock(game_clock)
+                    if record_dir:
+                        recording = Replay('classic', game.seed, game.difficulty)
             else:
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = event.pos
                     if game.speaker_rect.collidepoint(mouse_pos):
                         # Gestion du son
                         game.music_on = not game.music_on
                         pygame.mixer.music.set_volume(0.2 if game.music_on else 0)
                     else:
                         # Activer la coupe si on ne clique pas sur le haut-parleur
-                        game.mouse_pressed = True
-                        game.slice_at_position(mouse_pos)  # Commencer la coupe immédiatement
+                        play_input('down', mouse_pos)  # Commencer la coupe immédiatement
                 elif event.type == pygame.MOUSEBUTTONUP:
-                    game.mouse_pressed = False
+                    play_input('up')
                 elif event.type == pygame.MOUSEMOTION and game.mouse_pressed:
                     # Continuer la coupe pendant le mouvement si le bouton est enfoncé
-                    game.slice_at_position(pygame.mouse.get_pos())
+                    play_input('move', event.pos)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE and game.game_over:
+                        save_recording()
+                        recording = None
+                        use_clock(None)
+                        game.release_objects()
                         in_menu = True
+                        resume_gc()
                         menu = Menu()
                     else:
-                        game.handle_key(event.key)
+                        play_input('key', event.key)
         
+        profiler.mark('events')
+
         if in_menu:
             menu.draw(screen)
+            profiler.mark('menu')
         else:
-            mouse_pos = pygame.mouse.get_pos()
-            game.trail.add_point(mouse_pos)
-            game.update()
-            game.draw(screen)
-        
-        pygame.display.flip()
-        clock.tick(60)
+            # Simulation à pas fixe : 0, 1 ou plusieurs pas selon le temps écoulé depuis l'image précédente
+            for _ in range(timestep.advance()):
+                game.step(pygame.mouse.get_pos())
+                game_clock.tick()
+            game.draw(screen, timestep.alpha)
+        
+        profiler.draw(screen)
+        profiler.mark('overlay')
+        if in_menu:
+            if profiler.visible:
+                menu.dirty.invalidate()
+            menu.dirty.present()
+        else:
+            pygame.display.flip()
+        profiler.mark('flip')
+        # Les animations du menu avancent à chaque image : il reste limité à 60 FPS
+        clock.tick(60 if in_menu else RENDER_FPS)
+        profiler.mark('idle')
+        profiler.end_frame()
+
+    if not in_menu:
+        save_recording()
+    if game:
+        # Fenêtre fermée en pleine partie : les objets retournent aussi dans la réserve
+        game.release_objects()
+    print(rotation_cache.report())
+    quit_scene()
 
-    pygame.quit()
-    sys.exit()
+def run_scene():
+    # Lancement depuis le lanceur : même fenêtre, remise à la taille du mode Classic
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("Ninja Slicer")
+    slice_particles.clear()
+    main()
 
 if __name__ == "__main__":
     main()
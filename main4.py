@@ -1,4 +1,12 @@
-import pygame, random, sys, json, os, math
+import pygame, random, json, os, math, atexit
+import numpy as np
+from preloader import AssetPreloader
+from timestep import FixedTimestep, RENDER_FPS, lerp, get_ticks
+from profiler import FrameProfiler
+from dirty import DirtyRects, wait_events
+from layers import flatten_layers
+from pools import ObjectPool, pause_gc, resume_gc
+from scenes import quit_scene
 
 # ==============================
 # Initialization and Global Setup
@@ -10,6 +18,9 @@ WIDTH, HEIGHT = 800, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Fruit Slicer")
 
+# Frame profiler overlay, toggled with F3
+profiler = FrameProfiler("arcade")
+
 # Global constant: menu elements start at y = 150.
 MENU_Y_OFFSET = 150
 
@@ -82,22 +93,28 @@ background_music = "assets/sounds/background.mp3"
 victory_music   = load_sound("assets/sounds/youwon.wav")
 gameover_music  = load_sound("assets/sounds/gameover.wav")
 
-if os.path.exists(background_music):
-    pygame.mixer.music.load(background_music)
-    pygame.mixer.music.set_volume(0.5)
-    pygame.mixer.music.play(-1)
-else:
-    print(f"Background music not found: {background_music}")
+def start_music():
+    if os.path.exists(background_music):
+        pygame.mixer.music.load(background_music)
+        pygame.mixer.music.set_volume(0.5)
+        pygame.mixer.music.play(-1)
+    else:
+        print(f"Background music not found: {background_music}")
+
+start_music()
 
 # ==============================
 # Image Loading Helper and Asset Sizes
 # ==============================
 def load_and_resize_image(path, max_size):
+    return decode_and_resize_image(path, max_size).convert_alpha()
+
+def decode_and_resize_image(path, max_size):
+    # Safe to call from a loader thread: no convert_alpha() here.
     if not os.path.exists(path):
         print(f"Image file not found: {path}")
-        pygame.quit()
-        sys.exit()
-    img = pygame.image.load(path).convert_alpha()
+        return make_placeholder_image(max_size)
+    img = pygame.image.load(path)
     if "background" in path.lower():
         return pygame.transform.scale(img, (WIDTH, HEIGHT))
     rect = img.get_rect()
@@ -105,6 +122,102 @@ def load_and_resize_image(path, max_size):
     new_size = (int(rect.width * scale_ratio), int(rect.height * scale_ratio))
     return pygame.transform.scale(img, new_size)
 
+def make_placeholder_image(size):
+    # Stand-in for a missing file so the game keeps running.
+    placeholder = pygame.Surface(size, pygame.SRCALPHA)
+    placeholder.fill((200, 200, 200, 255))
+    pygame.draw.rect(placeholder, (255, 0, 255), placeholder.get_rect(), 2)
+    return placeholder
+
+# ==============================
+# Lazy Asset Registry
+# ==============================
+class AssetRegistry:
+    # Images are only registered at import; each one is decoded the first
+    # time it is requested and kept for the rest of the session.
+    def __init__(self):
+        self.loaders = {}
+        self.loaded = {}
+        self.used = set()
+        self.image_files = {}
+        self.placeholders = False  # Headless runs: blank images of the right size, nothing decoded
+
+    def use_placeholders(self):
+        self.placeholders = True
+        self.loaded.clear()
+
+    def register(self, name, loader):
+        self.loaders[name] = loader
+
+    def register_image(self, name, path, max_size):
+        self.register(name, lambda: load_and_resize_image(path, max_size))
+        self.image_files[name] = (path, max_size)
+
+    def preload(self, names, screen=None):
+        # Decode the given images on a thread pool while showing a loading screen;
+        # convert_alpha() runs back on the display thread.
+        preloader = AssetPreloader()
+        for name in names:
+            if name in self.loaded or name not in self.image_files:
+                continue
+            path, max_size = self.image_files[name]
+            preloader.add(name,
+                          lambda path=path, max_size=max_size: decode_and_resize_image(path, max_size),
+                          lambda surface, name=name: self.loaded.__setitem__(name, surface.convert_alpha()))
+        self.load_time = preloader.run(screen)
+
+    def get(self, name):
+        if name not in self.loaded:
+            if self.placeholders and name in self.image_files:
+                self.loaded[name] = make_placeholder_image(self.image_files[name][1])
+            else:
+                self.loaded[name] = self.loaders[name]()
+        self.used.add(name)
+        return self.loaded[name]
+
+    def unused_assets(self):
+        # Preloaded images only count once something actually asks for them.
+        return [name for name in self.loaders if name not in self.used]
+
+    def report_unused(self):
+        unused = self.unused_assets()
+        if unused:
+            print(f"Assets never used this session ({len(unused)}/{len(self.loaders)}): {', '.join(unused)}")
+
+class LazyImages:
+    # Dict-like view over a group of registry entries (e.g. all fruits).
+    def __init__(self, registry, names):
+        self.registry = registry
+        self.names = names
+
+    def __getitem__(self, key):
+        return self.registry.get(self.names[key])
+
+    def __contains__(self, key):
+        return key in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def keys(self):
+        return self.names.keys()
+
+    def get(self, key, default=None):
+        return self[key] if key in self.names else default
+
+def register_images(group, paths, max_size):
+    names = {}
+    for key, path in paths.items():
+        names[key] = f"{group}:{key}"
+        assets.register_image(names[key], path, max_size)
+    return LazyImages(assets, names)
+
+assets = AssetRegistry()
+atexit.register(assets.report_unused)
+
 MAX_SIZE_FRUIT     = (128, 128)
 MAX_SIZE_BOMB      = (100, 100)
 MAX_SIZE_ICE       = (100, 100)
@@ -114,62 +227,126 @@ MAX_SIZE_MEDAL     = (100, 100)
 MAX_SIZE_BACKGROUND= (WIDTH, HEIGHT)
 MAX_SIZE_WEAPON    = (80, 80)
 
-fruit_images = {
-    "apple": load_and_resize_image("assets/images/fruit_apple.png", MAX_SIZE_FRUIT),
-    "banana": load_and_resize_image("assets/images/fruit_banana.png", MAX_SIZE_FRUIT),
-    "orange": load_and_resize_image("assets/images/fruit_orange.png", MAX_SIZE_FRUIT),
-    "strawberry": load_and_resize_image("assets/images/fruit_strawberry.png", MAX_SIZE_FRUIT),
-    "watermelon": load_and_resize_image("assets/images/fruit_watermelon.png", MAX_SIZE_FRUIT),
-    "pineapple": load_and_resize_image("assets/images/fruit_pineapple.png", MAX_SIZE_FRUIT)
-}
-
-bomb_image = load_and_resize_image("assets/images/bomb.png", MAX_SIZE_BOMB)
-ice_image  = load_and_resize_image("assets/images/ice.png", MAX_SIZE_ICE)
-
-ship_images = {
-    "ship1": load_and_resize_image("assets/images/ship1.png", MAX_SIZE_SHIP),
-    "ship2": load_and_resize_image("assets/images/ship2.png", MAX_SIZE_SHIP),
-    "ship3": load_and_resize_image("assets/images/ship3.png", MAX_SIZE_SHIP)
-}
-
-character_images = {
-    "char1": load_and_resize_image("assets/images/char1.png", MAX_SIZE_CHARACTER),
-    "char2": load_and_resize_image("assets/images/char2.png", MAX_SIZE_CHARACTER),
-    "char3": load_and_resize_image("assets/images/char3.png", MAX_SIZE_CHARACTER)
-}
-
-medal_images = {
-    "bronze": load_and_resize_image("assets/images/bronze_medal.png", MAX_SIZE_MEDAL),
-    "silver": load_and_resize_image("assets/images/silver_medal.png", MAX_SIZE_MEDAL),
-    "gold": load_and_resize_image("assets/images/gold_medal.png", MAX_SIZE_MEDAL)
-}
-
-background_images = {
-    "menu": load_and_resize_image("assets/images/background1.jpg", MAX_SIZE_BACKGROUND),
-    "name": load_and_resize_image("assets/images/background2.jpg", MAX_SIZE_BACKGROUND),
-    "easy": load_and_resize_image("assets/images/background3.jpg", MAX_SIZE_BACKGROUND),
-    "medium": load_and_resize_image("assets/images/background4.jpg", MAX_SIZE_BACKGROUND),
-    "hard": load_and_resize_image("assets/images/background5.jpg", MAX_SIZE_BACKGROUND)
-}
-
-saber_images = {
-    "saber1": load_and_resize_image("assets/images/saber1.png", MAX_SIZE_WEAPON),
-    "saber2": load_and_resize_image("assets/images/saber2.png", MAX_SIZE_WEAPON),
-    "saber3": load_and_resize_image("assets/images/saber3.png", MAX_SIZE_WEAPON)
-}
+fruit_images = register_images("fruit", {
+    "apple": "assets/images/fruit_apple.png",
+    "banana": "assets/images/fruit_banana.png",
+    "orange": "assets/images/fruit_orange.png",
+    "strawberry": "assets/images/fruit_strawberry.png",
+    "watermelon": "assets/images/fruit_watermelon.png",
+    "pineapple": "assets/images/fruit_pineapple.png"
+}, MAX_SIZE_FRUIT)
+
+assets.register_image("bomb", "assets/images/bomb.png", MAX_SIZE_BOMB)
+assets.register_image("ice", "assets/images/ice.png", MAX_SIZE_ICE)
+
+ship_images = register_images("ship", {
+    "ship1": "assets/images/ship1.png",
+    "ship2": "assets/images/ship2.png",
+    "ship3": "assets/images/ship3.png"
+}, MAX_SIZE_SHIP)
+
+character_images = register_images("character", {
+    "char1": "assets/images/char1.png",
+    "char2": "assets/images/char2.png",
+    "char3": "assets/images/char3.png"
+}, MAX_SIZE_CHARACTER)
+
+medal_images = register_images("medal", {
+    "bronze": "assets/images/bronze_medal.png",
+    "silver": "assets/images/silver_medal.png",
+    "gold": "assets/images/gold_medal.png"
+}, MAX_SIZE_MEDAL)
+
+background_images = register_images("background", {
+    "menu": "assets/images/background1.jpg",
+    "name": "assets/images/background2.jpg",
+    "easy": "assets/images/background3.jpg",
+    "medium": "assets/images/background4.jpg",
+    "hard": "assets/images/background5.jpg"
+}, MAX_SIZE_BACKGROUND)
+
+saber_images = register_images("saber", {
+    "saber1": "assets/images/saber1.png",
+    "saber2": "assets/images/saber2.png",
+    "saber3": "assets/images/saber3.png"
+}, MAX_SIZE_WEAPON)
 
 THUMBNAIL_SIZE = (120, 90)
-background_thumbnails = {}
-for key, img in background_images.items():
-    background_thumbnails[key] = pygame.transform.scale(img, THUMBNAIL_SIZE)
+thumbnail_names = {}
+for key in background_images:
+    thumbnail_names[key] = f"thumbnail:{key}"
+    assets.register(thumbnail_names[key],
+                    lambda key=key: pygame.transform.scale(background_images[key], THUMBNAIL_SIZE))
+background_thumbnails = LazyImages(assets, thumbnail_names)
 
-menu_bg = background_images["menu"]
+# ==============================
+# Scaled Fruit Sprites
+# ==============================
+MIN_SPLIT_SCALE = 0.5  # A fruit at this scale or smaller no longer splits when hit
+
+def split_scales():
+    # Every scale a fruit can have: full size, then halved at each split (1, 0.5...)
+    scales = [1.0]
+    while scales[-1] > MIN_SPLIT_SCALE:
+        scales.append(scales[-1] / 2)
+    return scales
+
+def scale_fruit(image, scale):
+    if scale == 1.0:
+        return image
+    return pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+
+class FruitSprites:
+    # Each fruit image at every split scale, built once and shared by all fruits,
+    # so spawning the halves of a sliced fruit never scales a surface during play.
+    def __init__(self, images, scales):
+        self.images = images
+        self.scales = scales
+        self.chains = {}  # fruit name -> (base image, {scale: surface})
+
+    def get(self, name, scale=1.0):
+        base = self.images[name]
+        chain = self.chains.get(name)
+        if chain is None or chain[0] is not base:
+            # First use, or the registry now serves another image (headless placeholders)
+            chain = (base, {level: scale_fruit(base, level) for level in self.scales})
+            self.chains[name] = chain
+        levels = chain[1]
+        if scale not in levels:
+            levels[scale] = scale_fruit(base, scale)
+        return levels[scale]
+
+    def warm(self):
+        for name in self.images:
+            self.get(name)
+
+    def memory_by_scale(self):
+        # Bytes held by the scaled copies; full-size levels are the registry's own images
+        sizes = {}
+        for base, levels in self.chains.values():
+            for scale, surface in levels.items():
+                if surface is not base:
+                    sizes[scale] = sizes.get(scale, 0) + surface.get_pitch() * surface.get_height()
+        return sizes
+
+    def report_memory(self):
+        if not self.chains:
+            return
+        sizes = self.memory_by_scale()
+        details = ", ".join(f"{scale:g}x {size / 1024:.0f} KB" for scale, size in sorted(sizes.items(), reverse=True))
+        print(f"Fruit sprite cache: {len(self.chains)} fruits at scales "
+              f"{', '.join(f'{scale:g}' for scale in self.scales)}, "
+              f"{sum(sizes.values()) / 1024:.0f} KB of scaled copies ({details or 'none'})")
+
+fruit_sprites = FruitSprites(fruit_images, split_scales())
+atexit.register(fruit_sprites.report_memory)
 
 # ==============================
 # Load and Scale the Logo (LAPLateforme)
 # ==============================
-platform_logo = load_and_resize_image("assets/images/platform logo.png", (250, 250))
+assets.register_image("platform_logo", "assets/images/platform logo.png", (250, 250))
 def draw_logo():
+    platform_logo = assets.get("platform_logo")
     screen.blit(platform_logo, (WIDTH - platform_logo.get_width() - 10, 10))
 
 # ==============================
@@ -180,14 +357,216 @@ def draw_developers():
     dev_surface = dev_font.render(dev_text, True, FONT_COLOR)
     screen.blit(dev_surface, (10, HEIGHT - dev_surface.get_height() - 10))
 
+# ==============================
+# Entity Store: Array-Backed Physics
+# ==============================
+def round_like_rect(values):
+    # pygame.Rect rounds half away from zero when a float is assigned to it
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
+
+class StoredField:
+    # Entity attribute kept in its EntityStore's arrays while the entity is in a store,
+    # and in the entity's own `pending` dict before it is added and after it is removed.
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+        store = entity.store
+        if store is None:
+            return entity.pending[self.name]
+        return getattr(store, self.name)[store.slots[entity.handle]]
+
+    def __set__(self, entity, value):
+        store = entity.store
+        if store is None:
+            entity.pending[self.name] = value
+        else:
+            getattr(store, self.name)[store.slots[entity.handle]] = value
+
+class Entity:
+    __slots__ = ("store", "handle", "pending")
+    pool = None  # ObjectPool the entity returns to when it leaves its store
+
+    x = StoredField()
+    y = StoredField()
+    prev_x = StoredField()  # Position before the last step, used to interpolate drawing
+    prev_y = StoredField()
+    velocity_x = StoredField()
+    velocity_y = StoredField()
+    gravity = StoredField()
+    width = StoredField()
+    height = StoredField()
+
+    def __init__(self):
+        self.store = None
+        self.handle = None  # Stable index into store.slots while the entity is in a store
+        self.pending = {}
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+class EntityStore:
+    """
+    Positions, velocities and sizes of a group of entities in parallel NumPy arrays, so the
+    whole group moves and is culled in a few array operations instead of a Python loop.
+    Used like the list it replaces (append, remove, clear, len, in, iteration, [:]).
+    Slot i belongs to items[i]; removals keep the remaining entities in order, so drawing
+    and collision order are the same as with a list.
+    remove() and remove_where() only mark entities (they are no longer `in` the store and
+    overlap nothing); sweep() drops every marked entity at the end of the step. Entities
+    find their slot through a handle that does not change when others leave, so the
+    compaction is done entirely in array operations and removing a hit costs O(1).
+    """
+    FIELDS = ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "gravity", "width", "height")
+    # Per-slot arrays moved together when the store is compacted
+    SLOT_ARRAYS = FIELDS + ("items", "handles", "removed")
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = capacity
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(capacity))
+        self.items = np.empty(capacity, dtype=object)      # Entity in each slot
+        self.handles = np.zeros(capacity, dtype=np.intp)   # Handle of the entity in each slot
+        self.removed = np.zeros(capacity, dtype=bool)      # Marked by remove(), dropped by sweep()
+        self.slots = np.zeros(capacity, dtype=np.intp)     # Slot of each handle
+        self.free_handles = []
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.items[:self.count].tolist())
+
+    def __getitem__(self, index):
+        return self.items[:self.count].tolist()[index]
+
+    def __contains__(self, entity):
+        return entity.store is self and not self.removed[self.slots[entity.handle]]
+
+    def live(self, field):
+        # View of one per-slot array for the entities currently in the store
+        return getattr(self, field)[:self.count]
+
+    def grow(self):
+        self.capacity *= 2
+        for name in self.SLOT_ARRAYS + ("slots",):
+            old = getattr(self, name)
+            array = np.zeros(self.capacity, dtype=old.dtype)
+            array[:len(old)] = old
+            setattr(self, name, array)
+
+    def append(self, entity):
+        slot = self.count
+        if slot == self.capacity:
+            self.grow()
+        # Handles in use are always 0..count-1 plus the free ones
+        handle = self.free_handles.pop() if self.free_handles else slot
+        for field in self.FIELDS:
+            if not field.startswith("prev_"):
+                getattr(self, field)[slot] = entity.pending[field]
+        # A new entity has no previous step: it is drawn where it is until it first moves
+        self.prev_x[slot], self.prev_y[slot] = self.x[slot], self.y[slot]
+        self.items[slot], self.handles[slot], self.removed[slot] = entity, handle, False
+        self.slots[handle] = slot
+        entity.store, entity.handle = self, handle
+        self.count += 1
+
+    def detach(self, slots):
+        # Copy the values of the entities in slots back to them, so they stay readable outside the store
+        rows = np.column_stack([getattr(self, field)[slots] for field in self.FIELDS]).tolist()
+        for entity, row in zip(self.items[slots].tolist(), rows):
+            entity.pending.update(zip(self.FIELDS, row))
+            entity.store = entity.handle = None
+            if entity.pool is not None:
+                entity.pool.release(entity)
+        self.free_handles.extend(self.handles[slots].tolist())
+
+    def remove(self, entity):
+        self.removed[self.slots[entity.handle]] = True
+
+    def remove_where(self, mask):
+        # Mark every entity whose mask entry is True
+        self.live("removed")[mask] = True
+
+    def sweep(self):
+        # Drop the entities marked since the last sweep in one stable compaction pass
+        mask = self.live("removed")
+        slots = np.flatnonzero(mask)
+        if not len(slots):
+            return
+        self.detach(slots)
+        # Entities before the first removed one keep their slot
+        first, count = int(slots[0]), self.count
+        keep = ~mask[first:]
+        remaining = first + int(keep.sum())
+        for name in self.SLOT_ARRAYS:
+            array = getattr(self, name)
+            array[first:remaining] = array[first:count][keep]
+        self.items[remaining:count] = None
+        self.slots[self.handles[first:remaining]] = np.arange(first, remaining)
+        self.count = remaining
+
+    def clear(self):
+        self.detach(np.arange(self.count))
+        self.items[:self.count] = None
+        self.count = 0
+        self.free_handles = []
+
+    def integrate(self):
+        # One physics step for every entity, with the same rounding as moving a pygame.Rect
+        x, y = self.live("x"), self.live("y")
+        self.live("prev_x")[:] = x
+        self.live("prev_y")[:] = y
+        velocity_y = self.live("velocity_y")
+        velocity_y += self.live("gravity")
+        x[:] = round_like_rect(x + self.live("velocity_x"))
+        y[:] = round_like_rect(y + velocity_y)
+
+    def hold(self):
+        # Entities that do not move this step have nothing to interpolate
+        self.live("prev_x")[:] = self.live("x")
+        self.live("prev_y")[:] = self.live("y")
+
+    def boxes(self):
+        # One (x, y, width, height) row per entity
+        return np.column_stack([self.live(field) for field in ("x", "y", "width", "height")])
+
+    def overlaps(self, boxes, start=0):
+        """
+        Overlap matrix of boxes (rows of x, y, width, height) against the entities from slot
+        start on, with the same test as Rect.colliderect; removed entities overlap nothing
+        """
+        x, y = self.live("x")[start:], self.live("y")[start:]
+        right, bottom = x + self.live("width")[start:], y + self.live("height")[start:]
+        left, top, width, height = (column[:, None] for column in boxes.T)
+        return ((x < left + width) & (right > left) & (y < top + height) & (bottom > top) &
+                ~self.live("removed")[start:])
+
+    def entities(self, row, start=0):
+        # Entities of one overlap matrix row, in store order
+        return self.items[start:start + len(row)][row].tolist()
+
+    def positions(self, alpha=1.0):
+        # Draw positions between the last two steps
+        x = self.live("prev_x") + (self.live("x") - self.live("prev_x")) * alpha
+        y = self.live("prev_y") + (self.live("y") - self.live("prev_y")) * alpha
+        return zip(x.tolist(), y.tolist())
+
 # ==============================
 # Global Game Variables and States
 # ==============================
 player_speed = 10
 weapon_speed = 15
 max_weapons = 3
-objects = []
-weapons = []
+objects = EntityStore()
+weapons = EntityStore(capacity=max_weapons)
+# All gameplay randomness (spawns, trajectories, fruit choice) comes from this generator,
+# so seeding it replays the same round.
+rng = random.Random()
 
 ROUND_DURATION = 30000
 
@@ -321,25 +700,30 @@ def go_to_menu():
 # Menu Helper Function (with Developer Names)
 # ==============================
 def run_menu_screen(title_text, buttons, bg_image=None, bottom_text=None):
+    # Nothing on these screens moves: draw once, then sleep until the next event
+    resume_gc()
+    dirty = DirtyRects()
     running = True
     while running:
-        if bg_image:
-            screen.blit(bg_image, (0, 0))
-        else:
-            screen.fill((220, 220, 220))
-        title_surface = title_font.render(title_text, True, FONT_COLOR)
-        screen.blit(title_surface, (WIDTH//2 - title_surface.get_width()//2, MENU_Y_OFFSET - 100))
-        for btn in buttons:
-            btn.draw(screen)
-        draw_logo()
-        draw_developers()
-        if bottom_text:
-            bottom_surface = menu_font.render(bottom_text, True, FONT_COLOR)
-            screen.blit(bottom_surface, (10, HEIGHT - bottom_surface.get_height() - 20))
-        pygame.display.flip()
-        for event in pygame.event.get():
+        if dirty.full:
+            if bg_image:
+                screen.blit(bg_image, (0, 0))
+            else:
+                screen.fill((220, 220, 220))
+            title_surface = title_font.render(title_text, True, FONT_COLOR)
+            screen.blit(title_surface, (WIDTH//2 - title_surface.get_width()//2, MENU_Y_OFFSET - 100))
+            for btn in buttons:
+                btn.draw(screen)
+            draw_logo()
+            draw_developers()
+            if bottom_text:
+                bottom_surface = menu_font.render(bottom_text, True, FONT_COLOR)
+                screen.blit(bottom_surface, (10, HEIGHT - bottom_surface.get_height() - 20))
+            dirty.present()
+        for event in wait_events():
+            dirty.handle_event(event)
             if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
+                quit_scene()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = event.pos
                 for btn in buttons:
@@ -362,7 +746,7 @@ def menu_language():
         current_language = "fr"
     btn1 = Button(WIDTH//2 - BUTTON_WIDTH//2, MENU_Y_OFFSET, BUTTON_WIDTH, BUTTON_HEIGHT, "English", callback=set_en)
     btn2 = Button(WIDTH//2 - BUTTON_WIDTH//2, MENU_Y_OFFSET + 80, BUTTON_WIDTH, BUTTON_HEIGHT, "Français", callback=set_fr)
-    run_menu_screen("Select Language", [btn1, btn2], bg_image=menu_bg)
+    run_menu_screen("Select Language", [btn1, btn2], bg_image=background_images["menu"])
 
 def menu_difficulty():
     global current_difficulty
@@ -381,7 +765,7 @@ def menu_difficulty():
                         languages[current_language]['medium'], callback=set_medium)
     btn_hard = Button(WIDTH//2 - BUTTON_WIDTH//2, MENU_Y_OFFSET + 180, BUTTON_WIDTH, BUTTON_HEIGHT,
                       languages[current_language]['hard'], callback=set_hard)
-    run_menu_screen(languages[current_language]['title'], [btn_easy, btn_medium, btn_hard], bg_image=menu_bg)
+    run_menu_screen(languages[current_language]['title'], [btn_easy, btn_medium, btn_hard], bg_image=background_images["menu"])
 
 def menu_background():
     global selected_background
@@ -409,7 +793,7 @@ def menu_background():
     btn5 = Button(WIDTH//2 - BUTTON_WIDTH//2, y, BUTTON_WIDTH, BUTTON_HEIGHT,
                   languages[current_language]['background_hard'], callback=lambda: set_bg("hard"),
                   image=background_thumbnails["hard"])
-    run_menu_screen(languages[current_language]['select_background'], [btn1, btn2, btn3, btn4, btn5], bg_image=menu_bg)
+    run_menu_screen(languages[current_language]['select_background'], [btn1, btn2, btn3, btn4, btn5], bg_image=background_images["menu"])
 
 def menu_weapon():
     global selected_weapon
@@ -425,7 +809,7 @@ def menu_weapon():
     btn3 = Button(WIDTH//2 - BUTTON_WIDTH//2, MENU_Y_OFFSET + 180, BUTTON_WIDTH, BUTTON_HEIGHT,
                   languages[current_language]['weapon3'], callback=lambda: set_weapon("saber3"),
                   image=saber_images["saber3"])
-    run_menu_screen(languages[current_language]['select_weapon'], [btn1, btn2, btn3], bg_image=menu_bg)
+    run_menu_screen(languages[current_language]['select_weapon'], [btn1, btn2, btn3], bg_image=background_images["menu"])
 
 def menu_ship():
     global selected_ship
@@ -441,7 +825,7 @@ def menu_ship():
     btn3 = Button(WIDTH//2 - BUTTON_WIDTH//2, MENU_Y_OFFSET + 180, BUTTON_WIDTH, BUTTON_HEIGHT,
                   languages[current_language]['ship3'], callback=lambda: set_ship("ship3"),
                   image=ship_images["ship3"])
-    run_menu_screen(languages[current_language]['select_ship'], [btn1, btn2, btn3], bg_image=menu_bg)
+    run_menu_screen(languages[current_language]['select_ship'], [btn1, btn2, btn3], bg_image=background_images["menu"])
 
 def menu_character():
     global selected_character
@@ -457,12 +841,13 @@ def menu_character():
     btn3 = Button(WIDTH//2 - BUTTON_WIDTH//2, MENU_Y_OFFSET + 180, BUTTON_WIDTH, BUTTON_HEIGHT,
                   languages[current_language]['char3'], callback=lambda: set_char("char3"),
                   image=character_images["char3"])
-    run_menu_screen(languages[current_language]['select_character'], [btn1, btn2, btn3], bg_image=menu_bg)
+    run_menu_screen(languages[current_language]['select_character'], [btn1, btn2, btn3], bg_image=background_images["menu"])
 
 # ==============================
 # New Name Input Screen
 # ==============================
 def input_new_name():
+    resume_gc()
     pygame.event.clear()
     input_text = ""
     clock = pygame.time.Clock()
@@ -472,24 +857,28 @@ def input_new_name():
     if os.path.exists(PLAYER_NAME_FILE):
         with open(PLAYER_NAME_FILE, "r") as f:
             input_text = f.read().strip()
+    # Only the input box changes while typing; the loop sleeps between key presses
+    dirty = DirtyRects()
     while True:
-        screen.blit(menu_bg, (0, 0))
+        screen.blit(background_images["menu"], (0, 0))
         prompt_surface = menu_font.render(prompt, True, FONT_COLOR)
         screen.blit(prompt_surface, (WIDTH//2 - prompt_surface.get_width()//2, MENU_Y_OFFSET - 20))
         pygame.draw.rect(screen, (255, 255, 255), input_box)
         pygame.draw.rect(screen, BLACK, input_box, 2)
         text_surface = menu_font.render(input_text, True, FONT_COLOR)
         screen.blit(text_surface, (input_box.x + 5, input_box.y + 10))
+        dirty.track("input", input_box.union(text_surface.get_rect(topleft=(input_box.x + 5, input_box.y + 10))), input_text)
         pygame.draw.rect(screen, (200, 200, 200), ok_box)
         pygame.draw.rect(screen, BLACK, ok_box, 2)
         ok_text = menu_font.render("OK", True, FONT_COLOR)
         screen.blit(ok_text, (ok_box.centerx - ok_text.get_width()//2, ok_box.centery - ok_text.get_height()//2))
         draw_logo()
         draw_developers()
-        pygame.display.flip()
-        for event in pygame.event.get():
+        dirty.present()
+        for event in wait_events():
+            dirty.handle_event(event)
             if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
+                quit_scene()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
                     final_name = input_text if input_text != "" else "Player"
@@ -523,6 +912,7 @@ class Player:
         self.update_image()
         self.x = WIDTH//2 - self.width//2
         self.y = HEIGHT - self.height - 10
+        self.prev_x = self.x  # Position at the start of the current simulation step
 
     def update_image(self):
         ship_image = ship_images.get(selected_ship, ship_images["ship1"])
@@ -530,8 +920,8 @@ class Player:
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
-    def draw(self):
-        screen.blit(self.image, (self.x, self.y))
+    def draw(self, alpha=1.0):
+        screen.blit(self.image, (lerp(self.prev_x, self.x, alpha), self.y))
 
     def move_left(self):
         if self.x > 0:
@@ -541,94 +931,100 @@ class Player:
         if self.x < WIDTH - self.width:
             self.x += self.speed
 
-class Weapon:
+class Weapon(Entity):
+    __slots__ = ("image",)
+
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        super().__init__()
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.x, self.y = x, y
+        self.velocity_x, self.velocity_y, self.gravity = 0, -weapon_speed, 0
         self.image = saber_images.get(selected_weapon, None)
         if self.image:
             self.width, self.height = self.image.get_size()
         else:
             self.width, self.height = (5, 20)
 
-    def move(self):
-        self.y -= weapon_speed
-
-    def draw(self):
+    def draw(self, alpha=1.0):
+        y = lerp(self.prev_y, self.y, alpha)
         if self.image:
-            screen.blit(self.image, (self.x, self.y))
+            screen.blit(self.image, (self.x, y))
         else:
-            pygame.draw.rect(screen, (255, 0, 0), (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, (255, 0, 0), (self.x, y, self.width, self.height))
+
+class GameObject(Entity):
+    __slots__ = ("type", "scale", "spawn_x", "spawn_y", "image")
 
-class GameObject:
     def __init__(self, obj_type, scale=1.0):
+        super().__init__()
+        self.reset(obj_type, scale)
+
+    def reset(self, obj_type, scale=1.0):
         self.type = obj_type
         self.scale = scale
         if self.type == "fruit":
-            self.spawn_x = random.randint(50, WIDTH - 50)
+            self.spawn_x = rng.randint(50, WIDTH - 50)
             self.spawn_y = HEIGHT - 50
-            self.velocity_x = random.uniform(-5, 5)
-            self.velocity_y = random.uniform(-25, -20)
+            self.velocity_x = rng.uniform(-5, 5)
+            self.velocity_y = rng.uniform(-25, -20)
         else:
-            self.spawn_x = random.randint(50, WIDTH - 50)
+            self.spawn_x = rng.randint(50, WIDTH - 50)
             self.spawn_y = -50
-            self.velocity_x = random.uniform(-3, 3)
-            self.velocity_y = random.uniform(5, 10)
+            self.velocity_x = rng.uniform(-3, 3)
+            self.velocity_y = rng.uniform(5, 10)
         self.image = self.load_image()
         self.width = self.image.get_width()
         self.height = self.image.get_height()
-        self.rect = pygame.Rect(self.spawn_x, self.spawn_y, self.width, self.height)
+        self.x, self.y = self.spawn_x, self.spawn_y
         self.gravity = 0.5
 
     def load_image(self):
         if self.type == "fruit":
-            fruit_name = random.choice(list(fruit_images.keys()))
-            base_image = fruit_images[fruit_name]
-            if self.scale != 1.0:
-                return pygame.transform.scale(base_image,
-                                              (int(base_image.get_width() * self.scale),
-                                               int(base_image.get_height() * self.scale)))
-            return base_image
+            fruit_name = rng.choice(list(fruit_images.keys()))
+            return fruit_sprites.get(fruit_name, self.scale)
         elif self.type == "ice":
-            return ice_image
+            return assets.get("ice")
         elif self.type == "bomb":
-            return bomb_image
+            return assets.get("bomb")
         else:
             return pygame.Surface((50, 50))
 
-    def update(self):
-        self.velocity_y += self.gravity
-        self.rect.x += self.velocity_x
-        self.rect.y += self.velocity_y
-
-    def draw(self):
-        screen.blit(self.image, (self.rect.x, self.rect.y))
+# Objects and weapons leaving play go back to their pool (EntityStore.detach) for the next spawn
+GameObject.pool = ObjectPool(GameObject, "objets Arcade")
+Weapon.pool = ObjectPool(Weapon, "armes Arcade")
 
-    def is_off_screen(self):
-        return (self.rect.y > HEIGHT + 50 or self.rect.x < -50 or self.rect.x > WIDTH + 50)
+def draw_objects(alpha=1.0):
+    # All objects in one blits() call, between their last two simulated positions
+    screen.blits(zip([obj.image for obj in objects], objects.positions(alpha)), doreturn=False)
 
 # ==============================
 # Object Spawning and Movement
 # ==============================
 def spawn_object():
-    obj_type = random.choices(["fruit", "ice", "bomb"], weights=[70, 15, 15])[0]
+    obj_type = rng.choices(["fruit", "ice", "bomb"], weights=[70, 15, 15])[0]
     if obj_type == "fruit":
-        count = random.randint(2, 3)
+        count = rng.randint(2, 3)
         for _ in range(count):
-            objects.append(GameObject("fruit"))
+            objects.append(GameObject.pool.acquire("fruit"))
     else:
-        objects.append(GameObject(obj_type))
+        objects.append(GameObject.pool.acquire(obj_type))
+
+def hold_objects():
+    # Frozen objects stay where they are, so there is nothing to interpolate
+    objects.hold()
 
 def move_objects():
     global frozen, freeze_end_time
-    if frozen and pygame.time.get_ticks() < freeze_end_time:
+    if frozen and get_ticks() < freeze_end_time:
+        hold_objects()
         return
     else:
         frozen = False
-    for obj in objects[:]:
-        obj.update()
-        if obj.is_off_screen():
-            objects.remove(obj)
+    objects.integrate()
+    x, y = objects.live("x"), objects.live("y")
+    objects.remove_where((y > HEIGHT + 50) | (x < -50) | (x > WIDTH + 50))
 
 def shoot_weapon(player):
     if len(weapons) < max_weapons:
@@ -636,41 +1032,87 @@ def shoot_weapon(player):
         offset = saber_img.get_width() // 2 if saber_img else 2
         weapon_x = player.x + player.width // 2 - offset
         weapon_y = player.y
-        weapons.append(Weapon(weapon_x, weapon_y))
+        weapons.append(Weapon.pool.acquire(weapon_x, weapon_y))
         if laser_sound:
             laser_sound.play()
 
 def move_weapons():
-    for w in weapons[:]:
-        w.move()
-        if w.y < -w.height:
-            weapons.remove(w)
+    weapons.integrate()
+    weapons.remove_where(weapons.live("y") < -weapons.live("height"))
+
+def spawn_if_due(current_time):
+    global last_spawn_time
+    if current_time - last_spawn_time > difficulty_levels[current_difficulty]["spawn_delay"]:
+        spawn_object()
+        last_spawn_time = current_time
+
+def step_game(player, keys):
+    # One fixed simulation step; keys maps K_LEFT / K_RIGHT to their pressed state.
+    global frozen
+    player.prev_x = player.x
+    if keys[pygame.K_LEFT]:
+        player.move_left()
+    if keys[pygame.K_RIGHT]:
+        player.move_right()
+    if not frozen:
+        move_objects()
+    else:
+        hold_objects()
+        if get_ticks() >= freeze_end_time:
+            frozen = False
+    move_weapons()
+    profiler.mark("update")
+    resolve_collisions(player)
+    # Everything culled or hit this step leaves the arrays in one pass
+    objects.sweep()
+    weapons.sweep()
+    profiler.mark("collision")
 
 # ==============================
 # Collision and Reward Logic
 # ==============================
-def check_collisions(player):
+def find_collisions(player):
+    """
+    Broad phase of one step: every weapon and the ship against every object in a single
+    batched AABB test. Returns the weapon boxes and the overlap matrix: one row per weapon,
+    then the ship's row, with one column per object.
+    """
+    boxes = np.vstack([weapons.boxes(), (player.x, player.y, player.width, player.height)])
+    return boxes[:-1], objects.overlaps(boxes)
+
+def resolve_collisions(player):
+    weapon_boxes, hits = find_collisions(player)
+    check_collisions(weapon_boxes, hits[:-1])
+    check_ship_collision(objects.entities(hits[-1]))
+
+def check_collisions(weapon_boxes, weapon_hits):
     global score, game_over, combo_count, last_combo_time, current_medal, frozen, freeze_end_time
-    for w in weapons[:]:
-        w_rect = pygame.Rect(w.x, w.y, w.width, w.height)
+    # Fruit halves split off by one weapon can still be hit by the next ones this step
+    spawned_from = len(objects)
+    for w, box, row in zip(weapons[:], weapon_boxes, weapon_hits):
+        if w not in weapons:
+            continue  # Left the screen during this step
+        # Objects already taken by an earlier weapon are skipped
+        hits = objects.entities(row & ~objects.live("removed")[:spawned_from])
+        if len(objects) > spawned_from:
+            hits += objects.entities(objects.overlaps(box[None], spawned_from)[0], spawned_from)
         fruits_hit = []
         non_fruit_hit = None
-        for obj in objects[:]:
-            if obj.rect.colliderect(w_rect):
-                if obj.type == "fruit":
-                    fruits_hit.append(obj)
-                else:
-                    non_fruit_hit = obj
-                    break
+        for obj in hits:
+            if obj.type == "fruit":
+                fruits_hit.append(obj)
+            else:
+                non_fruit_hit = obj
+                break
         # If ice is hit, freeze objects.
         if non_fruit_hit and non_fruit_hit.type == "ice":
             if non_fruit_hit in objects: objects.remove(non_fruit_hit)
             if w in weapons: weapons.remove(w)
             score += 1
             combo_count += 1
-            last_combo_time = pygame.time.get_ticks()
+            last_combo_time = get_ticks()
             frozen = True
-            freeze_end_time = pygame.time.get_ticks() + 3000
+            freeze_end_time = get_ticks() + 3000
             continue
         # New Medal Condition: only when frozen and exactly 2 fruits are hit.
         if frozen and len(fruits_hit) == 2:
@@ -679,20 +1121,20 @@ def check_collisions(player):
                 score += 1
             if w in weapons: weapons.remove(w)
             combo_count += 2
-            last_combo_time = pygame.time.get_ticks()
+            last_combo_time = get_ticks()
             if medal_sound:
                 medal_sound.play()
         elif len(fruits_hit) == 1:
             fruit = fruits_hit[0]
             if crush_sound:
                 crush_sound.play()
-            if fruit.scale > 0.5:
-                obj1 = GameObject("fruit", scale=fruit.scale/2)
-                obj1.rect.x, obj1.rect.y = fruit.rect.x, fruit.rect.y
+            if fruit.scale > MIN_SPLIT_SCALE:
+                obj1 = GameObject.pool.acquire("fruit", scale=fruit.scale/2)
+                obj1.x, obj1.y = fruit.x, fruit.y
                 obj1.velocity_x = fruit.velocity_x - 2
                 obj1.velocity_y = fruit.velocity_y
-                obj2 = GameObject("fruit", scale=fruit.scale/2)
-                obj2.rect.x, obj2.rect.y = fruit.rect.x + fruit.width//2, fruit.rect.y
+                obj2 = GameObject.pool.acquire("fruit", scale=fruit.scale/2)
+                obj2.x, obj2.y = fruit.x + fruit.width//2, fruit.y
                 obj2.velocity_x = fruit.velocity_x + 2
                 obj2.velocity_y = fruit.velocity_y
                 objects.append(obj1)
@@ -703,7 +1145,7 @@ def check_collisions(player):
                 weapons.remove(w)
             score += 1
             combo_count += 1
-            last_combo_time = pygame.time.get_ticks()
+            last_combo_time = get_ticks()
         if non_fruit_hit and non_fruit_hit.type == "bomb":
             if explosion_sound:
                 explosion_sound.play()
@@ -713,34 +1155,73 @@ def check_collisions(player):
                 weapons.remove(w)
             game_over = True
 
-def check_ship_collision(player):
+def check_ship_collision(ship_hits):
     global game_over
-    player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
-    for obj in objects:
-        if obj.type == "bomb" and obj.rect.colliderect(player_rect):
+    for obj in ship_hits:
+        if obj.type == "bomb" and obj in objects:
             if explosion_sound:
                 explosion_sound.play()
-            if obj in objects:
-                objects.remove(obj)
+            objects.remove(obj)
             game_over = True
             break
 
+# ==============================
+# HUD Layer: Score, Time and Selection Icons
+# ==============================
+HUD_POSITION = (10, 10)
+HUD_ICON_SIZE = (30, 30)
+
+class HudLayer:
+    # The HUD is composited into one surface, rebuilt only when its score, time or icons
+    # change (about once a second) and drawn with a single blit the rest of the time.
+    def __init__(self):
+        self.texts = {}         # line -> (string, rendered surface)
+        self.icon_sources = None
+        self.icons = None       # Character and saber icons, scaled once per selection
+        self.layer_parts = None
+        self.layer = None
+
+    def text(self, line, string):
+        cached = self.texts.get(line)
+        if cached is None or cached[0] != string:
+            cached = (string, game_font.render(string, True, FONT_COLOR))
+            self.texts[line] = cached
+        return cached[1]
+
+    def selection_icons(self):
+        sources = (character_images.get(selected_character, character_images["char1"]),
+                   saber_images.get(selected_weapon, saber_images["saber1"]))
+        if sources != self.icon_sources:
+            self.icon_sources = sources
+            self.icons = [pygame.transform.scale(image, HUD_ICON_SIZE) for image in sources]
+        return self.icons
+
+    def draw(self, time_remaining):
+        score_text = self.text("score", f"{languages[current_language]['score']}: {score}")
+        time_text = self.text("time", f"Time: {time_remaining}s")
+        person_logo, saber_icon = self.selection_icons()
+        parts = (score_text, time_text, person_logo, saber_icon)
+        if parts != self.layer_parts:
+            self.layer_parts = parts
+            icon_x = score_text.get_width() + 10
+            layers = [(score_text, (0, 0), 1.0), (time_text, (0, 20), 1.0),
+                      (person_logo, (icon_x, 0), 1.0), (saber_icon, (icon_x + 40, 0), 1.0)]
+            size = (max(x + surface.get_width() for surface, (x, y), _ in layers),
+                    max(y + surface.get_height() for surface, (x, y), _ in layers))
+            self.layer = flatten_layers(size, layers)
+        screen.blit(self.layer, HUD_POSITION, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+hud = HudLayer()
+
 def draw_score(time_remaining):
-    score_text = game_font.render(f"{languages[current_language]['score']}: {score}", True, FONT_COLOR)
-    time_text = game_font.render(f"Time: {time_remaining}s", True, FONT_COLOR)
-    screen.blit(score_text, (10, 10))
-    screen.blit(time_text, (10, 30))
-    person_logo = pygame.transform.scale(character_images.get(selected_character, character_images["char1"]), (30, 30))
-    screen.blit(person_logo, (10 + score_text.get_width() + 10, 10))
-    saber_icon = pygame.transform.scale(saber_images.get(selected_weapon, saber_images["saber1"]), (30, 30))
-    screen.blit(saber_icon, (10 + score_text.get_width() + 10 + 40, 10))
+    hud.draw(time_remaining)
 
 # ==============================
 # Victory Animation: Orbiting Animation
 # ==============================
 def animate_victory():
     duration = 2000
-    start_time = pygame.time.get_ticks()
+    start_time = get_ticks()
     center_x = WIDTH / 2
     center_y = HEIGHT / 2
     # Define three radii for the orbits.
@@ -748,7 +1229,7 @@ def animate_victory():
     R_middle = 120 # for character
     R_inner = 60   # for ship
     while True:
-        t = pygame.time.get_ticks() - start_time
+        t = get_ticks() - start_time
         progress = t / duration
         if progress > 1:
             progress = 1
@@ -789,7 +1270,7 @@ def animate_victory():
 # ==============================
 def animate_loss():
     duration = 2000
-    start_time = pygame.time.get_ticks()
+    start_time = get_ticks()
     temp_player = Player()
     ship_center = (temp_player.x + temp_player.width/2, temp_player.y + temp_player.height/2)
     bomb_starts = []
@@ -805,7 +1286,7 @@ def animate_loss():
             pos = (random.randint(0, WIDTH), HEIGHT)
         bomb_starts.append(pos)
     while True:
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         progress = (current_time - start_time) / duration
         if progress > 1:
             progress = 1
@@ -814,7 +1295,7 @@ def animate_loss():
         for pos in bomb_starts:
             cur_x = pos[0] + (ship_center[0] - pos[0]) * progress
             cur_y = pos[1] + (ship_center[1] - pos[1]) * progress
-            screen.blit(bomb_image, (cur_x, cur_y))
+            screen.blit(assets.get("bomb"), (cur_x, cur_y))
             if progress >= 0.9:
                 if explosion_sound:
                     explosion_sound.play()
@@ -841,17 +1322,19 @@ def show_victory_screen():
     draw_logo()
     draw_developers()
     pygame.display.flip()
+    # The round is over: collect what it left behind while the screen waits for a click
+    resume_gc()
     waiting = True
     while waiting:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
+                quit_scene()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 waiting = False
     if victory_music:
         victory_music.stop()
     pygame.mixer.music.play(-1)
-    return pygame.time.get_ticks()
+    return get_ticks()
 
 def show_game_over_screen():
     global game_over, game_state
@@ -869,14 +1352,16 @@ def show_game_over_screen():
     draw_logo()
     draw_developers()
     pygame.display.flip()
+    # The round is over: collect what it left behind while the screen waits for a click
+    resume_gc()
     waiting = True
     while waiting:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
+                quit_scene()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 waiting = False
-                return pygame.time.get_ticks()
+                return get_ticks()
     if gameover_music:
         gameover_music.stop()
     pygame.mixer.music.play(-1)
@@ -890,66 +1375,72 @@ def main():
     player = Player()
     weapons.clear()
     clock = pygame.time.Clock()
-    round_start_time = pygame.time.get_ticks()
-    last_spawn_time = pygame.time.get_ticks()
+    timestep = FixedTimestep()
+    round_start_time = get_ticks()
+    last_spawn_time = get_ticks()
     running = True
+    profiler.begin_frame()
     while running:
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         elapsed = current_time - round_start_time
         time_remaining = max(0, (ROUND_DURATION - elapsed) // 1000)
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 running = False
+            if profiler.handle_event(e):
+                continue
             if e.type == pygame.MOUSEBUTTONDOWN:
                 if in_game_menu_button.is_clicked(e.pos):
                     go_to_menu()
+                    timestep.reset()
             if game_state == STATE_GAME:
                 if e.type == pygame.KEYDOWN:
                     if e.key == pygame.K_UP:
                         shoot_weapon(player)
-        keys = pygame.key.get_pressed()
+        profiler.mark("events")
         if game_state == STATE_GAME:
-            if keys[pygame.K_LEFT]:
-                player.move_left()
-            if keys[pygame.K_RIGHT]:
-                player.move_right()
+            pause_gc()
             if elapsed < ROUND_DURATION and not game_over:
-                if current_time - last_spawn_time > difficulty_levels[current_difficulty]["spawn_delay"]:
-                    spawn_object()
-                    last_spawn_time = current_time
+                spawn_if_due(current_time)
             if elapsed > ROUND_DURATION and not game_over:
                 new_start = show_victory_screen()
                 if new_start is not None:
                     round_start_time = new_start
                 else:
                     game_state = STATE_MENU
-            if not frozen:
-                move_objects()
-            else:
-                if current_time >= freeze_end_time:
-                    frozen = False
-            move_weapons()
-            check_collisions(player)
-            check_ship_collision(player)
+                timestep.reset()
+            # Fixed-timestep simulation: as many steps as the elapsed time requires
+            for _ in range(timestep.advance()):
+                step_game(player, pygame.key.get_pressed())
+            # Draw between the last two simulated states
+            alpha = timestep.alpha
             bg_key = selected_background if selected_background in background_images and selected_background not in ["menu", "name"] else current_difficulty
             screen.blit(background_images[bg_key], (0, 0))
-            for obj in objects:
-                obj.draw()
-            player.draw()
+            profiler.mark("background")
+            draw_objects(alpha)
+            player.draw(alpha)
             for w in weapons:
-                w.draw()
+                w.draw(alpha)
+            profiler.mark("objects")
             draw_score(time_remaining)
             draw_logo()
             draw_developers()
             in_game_menu_button.draw(screen)
+            profiler.mark("hud")
             if game_over:
                 new_start = show_game_over_screen()
                 if new_start is not None:
                     round_start_time = new_start
                     reset_game_state()
+                timestep.reset()
+        profiler.draw(screen)
+        profiler.mark("overlay")
         pygame.display.flip()
-        clock.tick(60)
-    pygame.quit()
+        profiler.mark("flip")
+        clock.tick(RENDER_FPS)
+        profiler.mark("idle")
+        profiler.end_frame()
+    quit_scene()
 
 # ==============================
 # Reset Game State (for Restart)
@@ -988,6 +1479,22 @@ def setup_game():
     pygame.mixer.music.play(-1)
     game_state = STATE_GAME
 
+# Images needed for the menus and the first seconds of play; everything else stays lazy.
+PRELOAD_ASSETS = ["background:menu", "platform_logo", "bomb", "ice"] + [f"fruit:{key}" for key in fruit_images]
+
+def run_scene():
+    # Started from the launcher: same window resized for Arcade, images already decoded stay loaded
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Fruit Slicer")
+    start_music()
+    assets.preload(PRELOAD_ASSETS, screen)
+    fruit_sprites.warm()
+    reset_game_state()
+    setup_game()
+    main()
+
 if __name__ == "__main__":
+    assets.preload(PRELOAD_ASSETS, screen)
+    fruit_sprites.warm()
     setup_game()
     main()
@@ -0,0 +1,119 @@
+"""
+Système de particules partagé (découpes du mode Classic, lanceur)
+Les particules sont stockées dans des tableaux NumPy (un tableau par propriété)
+avec une capacité fixe : les nouvelles particules remplacent les plus anciennes.
+"""
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    MAX_SPRITES = 1024  # Nombre maximal de sprites de points gardés en cache
+
+    def __init__(self, capacity=4096, gravity=0.0, shrink=0.1, decay=1):
+        self.capacity = capacity
+        self.gravity = gravity  # Ajouté à vy à chaque frame
+        self.shrink = shrink    # Retiré à la taille à chaque frame
+        self.decay = decay      # Retiré à la durée de vie à chaque frame
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self.next = 0  # Prochaine case à écrire dans le buffer circulaire
+        self.rng = np.random.default_rng()
+        self.sprites = {}  # (couleur, rayon) -> surface du point
+
+    def emit(self, x, y, count, colors, speed=(2, 5), size=(2, 5), lifetime=30):
+        """
+        Ajoute count particules parties de (x, y) dans des directions aléatoires
+        x, y: position commune, ou tableaux d'une position par particule
+        colors: une couleur RGB, ou une liste de couleurs tirées au hasard
+        speed, size: intervalles (min, max) ; la taille est un entier comme random.randint
+        """
+        if count > self.capacity:
+            # Seules les dernières particules tiennent dans le buffer
+            count = self.capacity
+            if np.ndim(x):
+                x = np.asarray(x)[-count:]
+            if np.ndim(y):
+                y = np.asarray(y)[-count:]
+        indices = (self.next + np.arange(count)) % self.capacity
+        self.next = (self.next + count) % self.capacity
+
+        angle = self.rng.uniform(0, 2 * np.pi, count)
+        velocity = self.rng.uniform(speed[0], speed[1], count)
+        self.x[indices] = x
+        self.y[indices] = y
+        self.vx[indices] = np.cos(angle) * velocity
+        self.vy[indices] = np.sin(angle) * velocity
+        self.size[indices] = self.rng.integers(size[0], size[1] + 1, count)
+        self.life[indices] = lifetime
+
+        colors = np.asarray(colors, dtype=np.uint8)
+        if colors.ndim == 1:
+            self.color[indices] = colors
+        else:
+            self.color[indices] = colors[self.rng.integers(0, len(colors), count)]
+        self.alive[indices] = True
+
+    def update(self):
+        # Une seule étape vectorisée pour toutes les particules
+        self.x += self.vx
+        self.y += self.vy
+        self.vy += self.gravity
+        self.life -= self.decay
+        np.maximum(self.size - self.shrink, 0, out=self.size)
+        # Les particules mortes restent en place et seront écrasées par les suivantes
+        self.alive &= self.life > 0
+
+    def count(self):
+        return int(np.count_nonzero(self.alive))
+
+    def clear(self):
+        self.alive[:] = False
+
+    def rects(self):
+        # Zone couverte par chaque particule visible (pour pygame.display.update)
+        radius = self.size.astype(np.int32)
+        visible = np.flatnonzero(self.alive & (radius > 0))
+        radius = radius[visible]
+        left = self.x[visible].astype(np.int32) - radius
+        top = self.y[visible].astype(np.int32) - radius
+        return [pygame.Rect(x, y, r * 2, r * 2) for x, y, r in zip(left.tolist(), top.tolist(), radius.tolist())]
+
+    def sprite(self, color, radius):
+        key = (color, radius)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if len(self.sprites) >= ParticleSystem.MAX_SPRITES:
+                self.sprites.clear()
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, surface):
+        # Toutes les particules visibles en un seul appel à blits()
+        radius = self.size.astype(np.int32)
+        visible = np.flatnonzero(self.alive & (radius > 0))
+        if not len(visible):
+            return
+        radius = radius[visible]
+        left = self.x[visible].astype(np.int32) - radius
+        top = self.y[visible].astype(np.int32) - radius
+
+        # Un sprite par couple (couleur, rayon) distinct, retrouvé sans boucle Python par particule
+        colors = self.color[visible].astype(np.int64)
+        keys = (radius.astype(np.int64) << 24) | (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sprites = np.empty(len(unique_keys), dtype=object)
+        for i, key in enumerate(unique_keys.tolist()):
+            sprites[i] = self.sprite(((key >> 16) & 255, (key >> 8) & 255, key & 255), key >> 24)
+
+        surface.blits(zip(sprites[inverse].tolist(), zip(left.tolist(), top.tolist())), doreturn=False)
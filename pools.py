@@ -0,0 +1,93 @@
+"""
+Réserves d'objets réutilisables et ramasse-miettes différé (modes Classic et Arcade)
+Chaque objet qui sort du jeu (fruit tombé, fruit coupé, arme sortie de l'écran) retourne
+dans la réserve de sa classe ; l'apparition suivante le réinitialise avec reset() au lieu
+d'en créer un nouveau. Une partie ne crée donc plus d'objets une fois la réserve remplie,
+et le ramasse-miettes a beaucoup moins de travail.
+
+OBJECT_POOLS=0 : réserves désactivées (chaque apparition crée un objet), pour comparer.
+DEFER_GC=1 : pas de collecte automatique pendant les parties ; tout ce qui s'est accumulé
+est collecté au retour sur un écran de menu, où une pause ne se voit pas.
+"""
+import atexit
+import gc
+import os
+
+enabled = os.environ.get('OBJECT_POOLS', '1') != '0'
+DEFER_GC = os.environ.get('DEFER_GC') == '1'
+
+POOLS = []
+
+
+class ObjectPool:
+    """
+    Réserve d'objets d'une classe : acquire() réinitialise un objet rendu par release(),
+    ou en crée un s'il n'y en a plus. La classe fournit reset() avec les mêmes arguments
+    que son constructeur.
+    """
+    def __init__(self, cls, name):
+        self.cls = cls
+        self.name = name
+        self.free = []
+        self.in_use = 0       # Objets sortis de la réserve et pas encore rendus
+        self.high_water = 0   # Plus grand nombre d'objets sortis en même temps
+        self.created = 0
+        self.reused = 0
+        POOLS.append(self)
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        self.in_use -= 1
+        if enabled:
+            self.free.append(obj)
+
+    def reset_stats(self):
+        self.high_water = self.in_use
+        self.created = self.reused = 0
+
+    def stats(self):
+        return {'created': self.created, 'reused': self.reused, 'in_use': self.in_use,
+                'high_water': self.high_water, 'free': len(self.free)}
+
+
+def set_enabled(value):
+    # Active ou coupe la réutilisation ; les réserves sont vidées dans les deux cas
+    global enabled
+    enabled = value
+    for pool in POOLS:
+        pool.free.clear()
+
+
+def report():
+    for pool in POOLS:
+        if pool.created or pool.reused:
+            print(f"Réserve {pool.name} : {pool.created} créés, {pool.reused} réutilisés, "
+                  f"au plus {pool.high_water} en jeu")
+
+
+atexit.register(report)
+
+
+def pause_gc():
+    # Partie en cours : plus de collecte automatique (DEFER_GC=1)
+    if DEFER_GC and gc.isenabled():
+        gc.disable()
+
+
+def resume_gc():
+    # Écran de menu : collecte de ce que la partie a laissé, puis collecte automatique rétablie
+    if DEFER_GC and not gc.isenabled():
+        gc.collect()
+        gc.enable()
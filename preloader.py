@@ -0,0 +1,98 @@
+"""
+Chargement des assets en arrière-plan avec un écran de chargement
+Le décodage et le redimensionnement se font dans un pool de threads,
+la conversion (convert_alpha) et le stockage dans le thread de l'affichage.
+"""
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import pygame
+
+from scenes import quit_scene
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+NEON_BLUE = (0, 195, 255)
+
+
+class LoadingScreen:
+    def __init__(self, screen):
+        self.screen = screen
+        self.font = pygame.font.Font(None, 48)
+        self.small_font = pygame.font.Font(None, 28)
+
+    def draw(self, done, total, elapsed):
+        width, height = self.screen.get_size()
+        self.screen.fill(BLACK)
+
+        # Roue animée : 8 points dont l'opacité tourne avec le temps
+        center = (width // 2, height // 2 - 80)
+        for i in range(8):
+            angle = i * math.pi / 4 + elapsed * 4
+            brightness = 80 + int(175 * ((i + elapsed * 8) % 8) / 8)
+            pos = (center[0] + math.cos(angle) * 30, center[1] + math.sin(angle) * 30)
+            pygame.draw.circle(self.screen, (0, brightness * 195 // 255, brightness), pos, 6)
+
+        text = self.font.render(f"Chargement... {done}/{total}", True, WHITE)
+        self.screen.blit(text, text.get_rect(center=(width // 2, height // 2)))
+
+        # Barre de progression
+        bar = pygame.Rect(width // 4, height // 2 + 40, width // 2, 24)
+        progress = done / total if total else 1
+        pygame.draw.rect(self.screen, NEON_BLUE, (bar.x, bar.y, int(bar.width * progress), bar.height))
+        pygame.draw.rect(self.screen, WHITE, bar, 2)
+
+        time_text = self.small_font.render(f"{elapsed * 1000:.0f} ms", True, WHITE)
+        self.screen.blit(time_text, time_text.get_rect(center=(width // 2, bar.bottom + 30)))
+
+
+class AssetPreloader:
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.jobs = []
+        self.load_time = 0
+
+    def add(self, name, job, on_done, on_error=None):
+        """
+        job(): exécuté dans un thread du pool (décodage, découpe, redimensionnement)
+        on_done(résultat): exécuté dans le thread principal (convert_alpha, stockage)
+        on_error(exception): appelé si job ou on_done échoue
+        """
+        self.jobs.append((name, job, on_done, on_error))
+
+    def run(self, screen=None):
+        # Lance toutes les tâches et affiche la progression si un écran est fourni
+        start = time.perf_counter()
+        loading_screen = LoadingScreen(screen) if screen else None
+        total = len(self.jobs)
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {pool.submit(job): (name, on_done, on_error)
+                       for name, job, on_done, on_error in self.jobs}
+            while pending:
+                finished, _ = wait(pending, timeout=1 / 60, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name, on_done, on_error = pending.pop(future)
+                    try:
+                        on_done(future.result())
+                    except Exception as e:
+                        if on_error:
+                            on_error(e)
+                        else:
+                            print(f"Erreur de chargement pour {name}: {e}")
+                    done += 1
+
+                if loading_screen:
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            pool.shutdown(cancel_futures=True)
+                            quit_scene()
+                    loading_screen.draw(done, total, time.perf_counter() - start)
+                    pygame.display.flip()
+
+        self.jobs = []
+        self.load_time = time.perf_counter() - start
+        print(f"Assets chargés en {self.load_time * 1000:.0f} ms ({total} fichiers)")
+        return self.load_time
@@ -0,0 +1,165 @@
+"""
+Profileur de frames avec affichage par-dessus le jeu (F3)
+Chaque boucle appelle begin_frame(), puis mark('section') à la fin de chaque étape
+(événements, mise à jour, collisions, dessin...), puis end_frame(). Le temps écoulé
+depuis la marque précédente est attribué à la section nommée.
+
+Désactivé, le profileur remplace ses méthodes par une fonction vide : un appel de
+mark() ne coûte alors qu'un appel de fonction Python.
+
+PROFILE_CSV_DIR=dossier : profileur actif dès le lancement, et toutes les frames
+enregistrées dans dossier/<nom>-frames.csv à la fermeture du jeu.
+"""
+import atexit
+import csv
+import os
+import time
+from collections import deque
+
+import pygame
+
+HISTORY = 240                      # Frames gardées pour l'affichage
+HISTOGRAM_BUCKETS = [4, 8, 12, 16.7, 20, 25, 33.3, 50]  # Bornes hautes des barres (ms)
+
+# Couleurs des sections dans l'affichage, dans leur ordre d'apparition
+SECTION_COLORS = [
+    (0, 195, 255), (255, 0, 128), (0, 255, 128), (255, 200, 0),
+    (128, 0, 255), (255, 120, 0), (0, 128, 255), (200, 200, 200),
+]
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class FrameProfiler:
+    def __init__(self, name, csv_dir=None):
+        self.name = name
+        self.csv_dir = csv_dir if csv_dir is not None else os.environ.get('PROFILE_CSV_DIR')
+        self.sections = []          # Noms des sections, dans l'ordre de première apparition
+        self.history = deque(maxlen=HISTORY)  # (durée totale, {section: durée}) en secondes
+        self.samples = []           # Toutes les frames, pour le CSV
+        self.current = {}
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.visible = False
+        self.font = None
+        self.set_collecting(bool(self.csv_dir))
+        if self.csv_dir:
+            atexit.register(self.dump_csv)
+
+    def set_collecting(self, collecting):
+        # Les méthodes appelées à chaque frame deviennent des fonctions vides quand le profileur est coupé
+        self.collecting = collecting
+        if collecting:
+            self.begin_frame = self._begin_frame
+            self.mark = self._mark
+            self.end_frame = self._end_frame
+        else:
+            self.begin_frame = self.mark = self.end_frame = _noop
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.set_collecting(self.visible or bool(self.csv_dir))
+        if self.collecting:
+            self._begin_frame()
+
+    def handle_event(self, event):
+        # F3 affiche / masque le profileur ; renvoie True si l'événement est consommé
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.toggle()
+            return True
+        return False
+
+    def _begin_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.current = {}
+
+    def _mark(self, section):
+        now = time.perf_counter()
+        self.current[section] = self.current.get(section, 0.0) + now - self.last_mark
+        self.last_mark = now
+        if section not in self.sections:
+            self.sections.append(section)
+
+    def _end_frame(self):
+        now = time.perf_counter()
+        frame = (now - self.frame_start, self.current)
+        self.history.append(frame)
+        if self.csv_dir:
+            self.samples.append(frame)
+        # La frame suivante commence ici, pour ne rien perdre entre deux frames
+        self.frame_start = self.last_mark = now
+        self.current = {}
+
+    def fps(self):
+        total = sum(duration for duration, _ in self.history)
+        return len(self.history) / total if total else 0.0
+
+    def averages(self, frames=60):
+        # Durée moyenne de chaque section (ms) sur les dernières frames
+        recent = list(self.history)[-frames:]
+        if not recent:
+            return {}
+        return {section: sum(sections.get(section, 0.0) for _, sections in recent) * 1000 / len(recent)
+                for section in self.sections}
+
+    def histogram(self):
+        counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for duration, _ in self.history:
+            ms = duration * 1000
+            index = next((i for i, limit in enumerate(HISTOGRAM_BUCKETS) if ms <= limit), len(HISTOGRAM_BUCKETS))
+            counts[index] += 1
+        return counts
+
+    def draw(self, screen):
+        if not self.visible:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        width, height = 260, 132 + 16 * len(self.sections)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        averages = self.averages()
+        frame_ms = sum(averages.values())
+
+        title = f"{self.name}  {self.fps():.0f} FPS  {frame_ms:.1f} ms"
+        panel.blit(self.font.render(title, True, (255, 255, 255)), (8, 6))
+
+        # Histogramme des durées de frame
+        counts = self.histogram()
+        tallest = max(counts) or 1
+        bar_width = (width - 16) // len(counts)
+        for i, count in enumerate(counts):
+            bar_height = int(70 * count / tallest)
+            slow = i > HISTOGRAM_BUCKETS.index(16.7)
+            color = (255, 80, 80) if slow else (0, 255, 128)
+            pygame.draw.rect(panel, color, (8 + i * bar_width, 100 - bar_height, bar_width - 2, bar_height))
+        labels = ["4", "8", "12", "17", "20", "25", "33", "50", "+"]
+        for i, label in enumerate(labels):
+            panel.blit(self.font.render(label, True, (180, 180, 180)), (8 + i * bar_width, 104))
+
+        # Détail par section : barre proportionnelle à 16,7 ms
+        y = 126
+        for index, section in enumerate(self.sections):
+            ms = averages.get(section, 0.0)
+            color = SECTION_COLORS[index % len(SECTION_COLORS)]
+            pygame.draw.rect(panel, color, (8, y + 3, max(1, int(ms / 16.7 * 90)), 10))
+            panel.blit(self.font.render(f"{section:<10} {ms:6.2f} ms", True, (255, 255, 255)), (104, y))
+            y += 16
+
+        screen.blit(panel, (screen.get_width() - width - 10, 10))
+
+    def dump_csv(self):
+        if not self.samples:
+            return
+        os.makedirs(self.csv_dir, exist_ok=True)
+        path = os.path.join(self.csv_dir, f"{self.name}-frames.csv")
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'total_ms'] + [f"{section}_ms" for section in self.sections])
+            for index, (duration, sections) in enumerate(self.samples):
+                writer.writerow([index, f"{duration * 1000:.3f}"] +
+                                [f"{sections.get(section, 0.0) * 1000:.3f}" for section in self.sections])
+        print(f"Profil des frames enregistré dans {path} ({len(self.samples)} frames)")
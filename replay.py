@@ -0,0 +1,220 @@
+"""
+Enregistrement et relecture des parties (reproduction de bugs, benchmarks de non-régression)
+Un replay contient la graine de la partie et la liste des entrées du joueur, chacune
+datée par le numéro du pas de simulation. La relecture se fait sans fenêtre, aussi vite
+que possible, et doit retrouver exactement le même score.
+
+Format binaire (petit-boutiste) :
+    en-tête  '<4sBBQIi' : magie b'FSRP', version, mode (0 Classic, 1 Arcade),
+                          graine, nombre de pas, score final
+             'B' + octets UTF-8 : difficulté
+    corps    compressé avec zlib, une suite d'événements '<IBii' : pas, type, a, b
+
+Usage : python replay.py record classic|arcade FICHIER [--seed N] [--difficulty D]
+        python replay.py play FICHIER
+"""
+import argparse
+import random
+import struct
+import time
+import zlib
+
+from timestep import SIMULATION_RATE
+
+MAGIC = b'FSRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBBQIi')
+EVENT = struct.Struct('<IBii')
+
+MODES = ['classic', 'arcade']
+
+# Types d'événements
+DOWN = 1    # Bouton de la souris enfoncé : a, b = position
+MOVE = 2    # Souris déplacée (bouton enfoncé) : a, b = position
+UP = 3      # Bouton relâché
+KEY = 4     # Touche : a = code pygame
+ARCADE = 5  # Entrées Arcade du pas : a = masque LEFT | RIGHT | SHOOT
+
+LEFT = 1
+RIGHT = 2
+SHOOT = 4
+
+CLASSIC_ACTIONS = {'down': DOWN, 'move': MOVE, 'up': UP, 'key': KEY}
+
+
+class ReplayError(Exception):
+    pass
+
+
+class Replay:
+    def __init__(self, mode, seed, difficulty, events=None, steps=0, score=0):
+        self.mode = mode
+        self.seed = seed
+        self.difficulty = difficulty
+        self.events = events if events is not None else []  # (pas, type, a, b)
+        self.steps = steps  # Nombre de pas simulés pendant l'enregistrement
+        self.score = score  # Score final, vérifié à la relecture
+
+    def record(self, step, kind, a=0, b=0):
+        self.events.append((step, kind, int(a), int(b)))
+
+    def record_action(self, step, action, value=None):
+        # Entrée du mode Classic, au format de Game.apply_input
+        kind = CLASSIC_ACTIONS[action]
+        if kind in (DOWN, MOVE):
+            self.record(step, kind, value[0], value[1])
+        elif kind == KEY:
+            self.record(step, kind, value)
+        else:
+            self.record(step, kind)
+
+    def save(self, path):
+        body = b''.join(EVENT.pack(*event) for event in self.events)
+        difficulty = self.difficulty.encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, MODES.index(self.mode), self.seed, self.steps, self.score))
+            f.write(bytes([len(difficulty)]) + difficulty)
+            f.write(zlib.compress(body))
+
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size or data[:4] != MAGIC:
+            raise ReplayError(f"{path} n'est pas un replay")
+        magic, version, mode, seed, steps, score = HEADER.unpack_from(data)
+        if version != VERSION:
+            raise ReplayError(f"{path} : version {version} non prise en charge")
+        length = data[HEADER.size]
+        start = HEADER.size + 1
+        difficulty = data[start:start + length].decode('utf-8')
+        body = zlib.decompress(data[start + length:])
+        events = list(EVENT.iter_unpack(body))
+        return Replay(MODES[mode], seed, difficulty, events, steps, score)
+
+    def events_by_step(self):
+        by_step = {}
+        for step, kind, a, b in self.events:
+            by_step.setdefault(step, []).append((kind, a, b))
+        return by_step
+
+
+def record_classic_inputs(replay, inputs):
+    # Enregistre les entrées d'un script Classic ; les positions sont arrondies au pixel
+    # avant d'être jouées, pour que la relecture donne exactement la même partie
+    def recording(step, game):
+        actions = []
+        for action, value in inputs(step, game):
+            if action in ('down', 'move'):
+                value = (round(value[0]), round(value[1]))
+            replay.record_action(step, action, value)
+            actions.append((action, value))
+        return actions
+    return recording
+
+
+def classic_inputs(replay):
+    # Script Classic qui rejoue les entrées enregistrées
+    by_step = replay.events_by_step()
+    actions = {DOWN: 'down', MOVE: 'move', UP: 'up', KEY: 'key'}
+
+    def inputs(step, game):
+        played = []
+        for kind, a, b in by_step.get(step, ()):
+            if kind in (DOWN, MOVE):
+                played.append((actions[kind], (a, b)))
+            elif kind == KEY:
+                played.append(('key', a))
+            else:
+                played.append(('up', None))
+        return played
+    return inputs
+
+
+def arcade_mask(pressed):
+    return (LEFT if pressed['left'] else 0) | (RIGHT if pressed['right'] else 0) | (SHOOT if pressed['shoot'] else 0)
+
+
+def record_arcade_inputs(replay, inputs):
+    # Un événement seulement quand les entrées changent d'un pas à l'autre
+    last = [0]
+
+    def recording(step, player):
+        pressed = inputs(step, player)
+        mask = arcade_mask(pressed)
+        if mask != last[0]:
+            replay.record(step, ARCADE, mask)
+            last[0] = mask
+        return pressed
+    return recording
+
+
+def arcade_inputs(replay):
+    by_step = replay.events_by_step()
+    mask = [0]
+
+    def inputs(step, player):
+        for kind, a, b in by_step.get(step, ()):
+            mask[0] = a
+        return {'left': bool(mask[0] & LEFT), 'right': bool(mask[0] & RIGHT), 'shoot': bool(mask[0] & SHOOT)}
+    return inputs
+
+
+def record(mode, path, seed=0, difficulty=None):
+    # Enregistre une partie jouée par le script de headless.py
+    import headless
+    if mode == 'classic':
+        replay = Replay(mode, seed, difficulty or 'moyen')
+        bot = headless.classic_bot(random.Random(seed))
+        result = headless.run_classic(record_classic_inputs(replay, bot), seed, replay.difficulty)
+    else:
+        replay = Replay(mode, seed, difficulty or 'easy')
+        bot = headless.arcade_bot(random.Random(seed))
+        result = headless.run_arcade(record_arcade_inputs(replay, bot), seed, replay.difficulty)
+    replay.steps = result['steps']
+    replay.score = result['score']
+    replay.save(path)
+    return replay
+
+
+def play(replay):
+    """Rejoue la partie sans fenêtre ; renvoie le résultat de headless.run_classic / run_arcade"""
+    import headless
+    if replay.mode == 'classic':
+        return headless.run_classic(classic_inputs(replay), replay.seed, replay.difficulty, replay.steps)
+    return headless.run_arcade(arcade_inputs(replay), replay.seed, replay.difficulty, replay.steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enregistrement et relecture des parties")
+    commands = parser.add_subparsers(dest='command', required=True)
+    record_parser = commands.add_parser('record')
+    record_parser.add_argument('mode', choices=MODES)
+    record_parser.add_argument('path')
+    record_parser.add_argument('--seed', type=int, default=0)
+    record_parser.add_argument('--difficulty', default=None)
+    play_parser = commands.add_parser('play')
+    play_parser.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        replay = record(args.mode, args.path, args.seed, args.difficulty)
+        print(f"{args.path} : {len(replay.events)} événements, {replay.steps} pas, score {replay.score}")
+        return
+
+    replay = Replay.load(args.path)
+    start = time.perf_counter()
+    result = play(replay)
+    elapsed = time.perf_counter() - start
+    game_time = result['steps'] / SIMULATION_RATE
+    print(f"{replay.mode} ({replay.difficulty}), graine {replay.seed} : {result['steps']} pas en {elapsed:.2f} s "
+          f"(x{game_time / elapsed:.0f} le temps réel)")
+    if result['score'] == replay.score:
+        print(f"Score {result['score']} : identique à l'enregistrement")
+    else:
+        print(f"DIFFÉRENT : score {result['score']}, attendu {replay.score}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
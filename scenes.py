@@ -0,0 +1,59 @@
+"""
+Modes de jeu lancés dans le processus du lanceur
+main1 (Classic) et main4 (Arcade) ne sont importés qu'au premier lancement, puis restent
+en mémoire : ils partagent la fenêtre et le mixer du lanceur, et les images déjà chargées
+le restent d'une partie à l'autre. Changer de mode ne relance ni interpréteur, ni SDL,
+ni chargement des assets.
+Chaque mode redimensionne la fenêtre à sa taille ; le lanceur retrouve la sienne au retour.
+"""
+import importlib
+import sys
+
+import pygame
+
+from pools import resume_gc
+from timestep import use_clock
+
+# Nom de la scène -> module du mode de jeu (avec une fonction run_scene())
+SCENES = {'classic': 'main1', 'arcade': 'main4'}
+
+
+class SceneExit(Exception):
+    pass
+
+
+_embedded = False
+
+
+def quit_scene():
+    """
+    Le joueur ferme le jeu : retour au lanceur si le mode a été lancé par run_scene(),
+    sinon fin du programme (python main1.py, python main4.py)
+    """
+    if _embedded:
+        raise SceneExit
+    pygame.quit()
+    sys.exit()
+
+
+def run_scene(name):
+    """Lance le mode name et revient quand le joueur le ferme"""
+    global _embedded
+    size = pygame.display.get_surface().get_size()
+    caption = pygame.display.get_caption()[0]
+    module = importlib.import_module(SCENES[name])
+    _embedded = True
+    try:
+        module.run_scene()
+    except SceneExit:
+        pass
+    finally:
+        _embedded = False
+        # Rien de la partie ne doit continuer dans le lanceur
+        use_clock(None)
+        pygame.mixer.music.stop()
+        pygame.mixer.stop()
+        pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+        pygame.event.clear()
+        resume_gc()
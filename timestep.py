@@ -0,0 +1,82 @@
+"""
+Simulation à pas fixe, découplée de l'affichage (mode Classic et Arcade)
+La physique avance toujours par pas de 1/SIMULATION_RATE seconde, quel que soit
+le nombre d'images affichées par seconde ; l'affichage interpole entre les deux
+derniers états simulés.
+"""
+import os
+import time
+
+import pygame
+
+SIMULATION_RATE = 60  # Pas de simulation par seconde (vitesse de jeu d'origine à 60 FPS)
+# Limite d'images affichées par seconde, 0 = sans limite (ex. RENDER_FPS=0 python main1.py)
+RENDER_FPS = int(os.environ.get('RENDER_FPS', 60))
+
+
+class FixedTimestep:
+    def __init__(self, rate=SIMULATION_RATE, max_steps=5):
+        self.step = 1 / rate
+        # Au-delà de max_steps pas en retard (machine trop lente, fenêtre déplacée...),
+        # le retard est abandonné plutôt que rattrapé
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self):
+        """Renvoie le nombre de pas de simulation à exécuter pour cette image"""
+        now = time.perf_counter()
+        if self.last_time is not None:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        # Fraction du pas suivant déjà écoulée, pour interpoler l'affichage (entre 0 et 1)
+        return min(self.accumulator / self.step, 1.0)
+
+    def reset(self):
+        # À appeler après un écran bloquant pour ne pas rattraper le temps passé dessus
+        self.accumulator = 0.0
+        self.last_time = None
+
+
+def lerp(previous, current, alpha):
+    return previous + (current - previous) * alpha
+
+
+class SimulationClock:
+    # Horloge avancée à la main, d'un pas de simulation à la fois (mode sans fenêtre)
+    def __init__(self, rate=SIMULATION_RATE):
+        self.step_ms = 1000 / rate
+        self.time_ms = 0.0
+        self.steps = 0  # Nombre de pas écoulés
+
+    def tick(self):
+        self.time_ms += self.step_ms
+        self.steps += 1
+
+    def ticks(self):
+        return int(self.time_ms)
+
+
+_clock = None
+
+
+def use_clock(clock):
+    """Remplace le temps réel par une SimulationClock (None pour revenir au temps réel)"""
+    global _clock
+    _clock = clock
+
+
+def get_ticks():
+    # Millisecondes de jeu : pygame.time.get_ticks(), sauf en simulation
+    return _clock.ticks() if _clock else pygame.time.get_ticks()